@@ -0,0 +1,74 @@
+"""
+Micro-benchmark for converting TextNodes to HTML leaves.
+
+Converts the TextNodes of an inline-heavy paragraph three ways: one call per
+node to a replica of the previous text_node_to_html_node (which rebuilt its
+tag mapping dict and copied props on every call), one call per node to the
+current text_node_to_html_node, and a single text_nodes_to_html_nodes call
+for the whole run. Reports nanoseconds per node.
+
+Usage:
+    python3 benchmarks/bench_converter.py [--repeat N] [--segments N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from basepath import apply_basepath  # noqa: E402
+from converter import text_node_to_html_node, text_nodes_to_html_nodes  # noqa: E402
+from htmlnode import HTMLLeafNode  # noqa: E402
+from text_to_textnode import text_to_textnode  # noqa: E402
+from textnode import TextType  # noqa: E402
+
+SEGMENT = ("Some **bold** words, _italic_ words, `inline code`, a [link](/blog/tom) "
+           "and an ![image](/images/tom.png) in one sentence. ")
+
+
+def previous_text_node_to_html_node(text_node, basepath="/"):
+    """The converter before dispatch was precomputed, minus its disabled debug logging."""
+    tag_mapping = {
+        TextType.TEXT: (None, text_node.text, None),
+        TextType.BOLD: ("b", text_node.text, None),
+        TextType.ITALIC: ("i", text_node.text, None),
+        TextType.CODE: ("code", text_node.text, None),
+        TextType.LINK: ("a", text_node.text, {"href": apply_basepath(str(text_node.url), basepath)}),
+        TextType.IMAGE: ("img", "", {"alt": str(text_node.text), "src": apply_basepath(str(text_node.url), basepath)}),
+    }
+    tag, value, props = tag_mapping[text_node.text_type]
+    if props is not None:
+        props = {str(k): str(v) for k, v in props.items()}
+    return HTMLLeafNode.trusted(tag, value, props)
+
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per case; the best is reported")
+    parser.add_argument("--segments", type=int, default=2000, help="copies of the sample sentence")
+    args = parser.parse_args(argv)
+
+    text_nodes = text_to_textnode(SEGMENT * args.segments)
+    cases = [
+        ("previous, per node", lambda: [previous_text_node_to_html_node(node, "/repo/") for node in text_nodes]),
+        ("current, per node", lambda: [text_node_to_html_node(node, "/repo/") for node in text_nodes]),
+        ("current, batch", lambda: text_nodes_to_html_nodes(text_nodes, "/repo/")),
+    ]
+    print(f"{len(text_nodes)} nodes")
+    print(f"{'path':<20} {'ns/node':>8}")
+    for name, func in cases:
+        print(f"{name:<20} {best_time(func, args.repeat) * 1e9 / len(text_nodes):>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Serialization benchmark for HTML escaping.
+
+Renders the same page tree three ways: the serializer as it was before
+escaping (values and props written verbatim), the current serializer with
+the escape_text/escape_attr fast path, and the current serializer with
+html.escape applied to every leaf and prop value. Pages with no special
+characters show the cost of the fast path's checks alone; the "specials"
+column repeats the run on text full of &, < and >.
+
+Usage:
+    python3 benchmarks/bench_escape.py [--repeat N] [--pages N]
+"""
+import argparse
+import html
+import os
+import sys
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import htmlnode  # noqa: E402
+from htmlnode import HTMLLeafNode, HTMLParentNode  # noqa: E402
+from markdown_to_html_node import markdown_to_html_node  # noqa: E402
+
+PAGE = """# Title
+
+Some **bold** words, _italic_ words, `code` and a [link](/blog) in a paragraph.
+
+- one **item**
+- two _items_
+- three [items](/x)
+
+> A quote with `code` and ![an image](/img.png).
+"""
+
+SPECIALS_PAGE = PAGE.replace("words", "<words> & more")
+
+
+def unescaped_to_html(node):
+    """The serializer before escaping, with the same iterative walk."""
+    parts = []
+    write = parts.append
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.__class__ is str:
+            write(node)
+            continue
+        props = "".join([f' {key}="{value}"' for key, value in node.props.items()])
+        if isinstance(node, HTMLParentNode):
+            write(f"<{node.tag}{props}>")
+            stack.append(f"</{node.tag}>")
+            stack.extend(reversed(node.children))
+        elif node.tag is None:
+            write(node.value)
+        elif node.tag == "img":
+            write(f"<{node.tag}{props} />")
+        else:
+            write(f"<{node.tag}{props}>{node.value}</{node.tag}>")
+    return "".join(parts)
+
+
+def html_escape_everything(text):
+    return html.escape(text, quote=True)
+
+
+def best_of(func, tree, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(tree)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def count_leaves(node):
+    if isinstance(node, HTMLLeafNode):
+        return 1
+    return sum(count_leaves(child) for child in node.children)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the best is reported")
+    parser.add_argument("--pages", type=int, default=500, help="copies of the sample page in the tree")
+    args = parser.parse_args(argv)
+
+    print(f"{'serializer':<22} {'plain ns/leaf':>14} {'specials ns/leaf':>17}")
+    trees = [markdown_to_html_node("\n\n".join([page] * args.pages)) for page in (PAGE, SPECIALS_PAGE)]
+    leaves = [count_leaves(tree) for tree in trees]
+
+    def row(name, func):
+        times = [best_of(func, tree, args.repeat) * 1e9 / count for tree, count in zip(trees, leaves)]
+        print(f"{name:<22} {times[0]:>14.0f} {times[1]:>17.0f}")
+
+    row("unescaped (before)", unescaped_to_html)
+    row("fast-path escaping", lambda tree: tree.to_html())
+    with mock.patch.object(htmlnode, "escape_text", html_escape_everything), \
+            mock.patch.object(htmlnode, "escape_attr", html_escape_everything):
+        row("html.escape always", lambda tree: tree.to_html())
+
+
+if __name__ == "__main__":
+    main()
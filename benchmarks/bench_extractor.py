@@ -0,0 +1,62 @@
+"""
+Pathological-input benchmark for the markdown image/link extractor.
+
+Times extract_markdown_links and extract_markdown_images on adversarial inputs
+(long runs of "[", unclosed "(" and nested brackets) of doubling size, next to
+the nested-bracket pattern the extractor used to have. The old pattern's time
+grows roughly cubically on "[" runs; the current one stays linear, so its
+time per KB stays flat as the input grows.
+
+Usage:
+    python3 benchmarks/bench_extractor.py [--max-size N]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from extractor import extract_markdown_images, extract_markdown_links  # noqa: E402
+
+# The pattern extractor.py used before it was made backtracking-safe
+OLD_LINK_PATTERN = re.compile(r'\[([^\]]*(?:\[[^\]]*\][^\]]*)*)\]\(([^)]+)\)')
+
+CASES = {
+    "open brackets": "[",
+    "open images": "![",
+    "unclosed urls": "[a](",
+    "nested groups": "[a]",
+}
+# The old pattern is only timed up to this size; beyond it a run takes minutes
+OLD_PATTERN_LIMIT = 2000
+
+
+def timed(func, text):
+    start = time.perf_counter()
+    func(text)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-size", type=int, default=64000,
+                        help="largest number of repetitions of each adversarial unit")
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<15} {'repeats':>8} {'links ms':>9} {'images ms':>10} {'us/KB':>7} {'old ms':>9}")
+    for name, unit in CASES.items():
+        size = 1000
+        while size <= args.max_size:
+            text = "[" + unit * size if name == "nested groups" else unit * size
+            links = timed(extract_markdown_links, text)
+            images = timed(extract_markdown_images, text)
+            per_kb = (links + images) * 1e6 / (len(text) / 1000)
+            old = f"{timed(OLD_LINK_PATTERN.findall, text) * 1000:9.1f}" if size <= OLD_PATTERN_LIMIT else f"{'-':>9}"
+            print(f"{name:<15} {size:>8} {links * 1000:>9.2f} {images * 1000:>10.2f} {per_kb:>7.1f} {old}")
+            size *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark for inline markdown parsing on long, inline-heavy paragraphs.
+
+Parses paragraphs of increasing length with inline_to_html_nodes and with the
+full markdown_to_html_node pipeline and reports throughput. With a single-pass
+scanner the MB/s figure stays flat as the paragraph grows.
+
+Usage:
+    python3 benchmarks/bench_inline.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from inline_markdown import inline_to_html_nodes  # noqa: E402
+from markdown_to_html_node import markdown_to_html_node  # noqa: E402
+
+SEGMENT = ("Some **bold** words, _italic_ words, `inline code`, a [link](/blog/tom) "
+           "and an ![image](/images/tom.png) in one sentence. ")
+SIZES = (100, 1000, 10000)
+
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per case; the best is reported")
+    args = parser.parse_args(argv)
+
+    print(f"{'segments':>9} {'KB':>8} {'inline MB/s':>12} {'document MB/s':>14}")
+    for size in SIZES:
+        paragraph = SEGMENT * size
+        megabytes = len(paragraph.encode("utf-8")) / 1e6
+        inline = best_time(lambda: inline_to_html_nodes(paragraph), args.repeat)
+        document = best_time(lambda: markdown_to_html_node(paragraph), args.repeat)
+        print(f"{size:>9} {megabytes * 1000:>8.1f} {megabytes / inline:>12.2f} {megabytes / document:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
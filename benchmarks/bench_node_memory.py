@@ -0,0 +1,104 @@
+"""
+Memory benchmark for TextNode and HTMLNode trees.
+
+Measures bytes per node with tracemalloc for the __slots__ node classes and for
+dict-backed replicas of the previous classes (a per-instance __dict__ plus a
+fresh empty children list and props dict on every node), then the bytes per
+node of a whole rendered page tree.
+
+Usage:
+    python3 benchmarks/bench_node_memory.py [--count N]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from htmlnode import HTMLLeafNode, HTMLParentNode  # noqa: E402
+from markdown_to_html_node import markdown_to_html_node  # noqa: E402
+from textnode import TextNode, TextType  # noqa: E402
+
+
+class DictTextNode:
+    """The previous TextNode layout: attributes in a per-instance __dict__."""
+
+    def __init__(self, text, text_type, url=None):
+        self.text = text
+        self.text_type = text_type
+        self.url = url
+
+
+class DictHTMLNode:
+    """The previous HTMLNode layout: a __dict__ plus an empty list and dict per node."""
+
+    def __init__(self, tag=None, value=None, children=None, props=None):
+        self.tag = tag
+        self.value = value
+        self.children = children if children is not None else []
+        self.props = props if props is not None else {}
+
+
+PAGE = """# Title
+
+Some **bold** words, _italic_ words, `code` and a [link](/blog) in a paragraph.
+
+- one **item**
+- two _items_
+- three [items](/x)
+
+> A quote with `code`.
+"""
+
+
+def bytes_per_object(factory, count):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Don't charge the container list holding the objects
+    total -= sys.getsizeof(objects)
+    return total / count
+
+
+def count_nodes(node):
+    return 1 + sum(count_nodes(child) for child in node.children)
+
+
+def tree_bytes_per_node(repeat):
+    markdown = "\n\n".join([PAGE] * repeat)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tree = markdown_to_html_node(markdown)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return total / count_nodes(tree)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100000, help="nodes allocated per measurement")
+    args = parser.parse_args(argv)
+
+    # Share one value string so only the node layout is measured
+    text = "text"
+    cases = [
+        ("TextNode", lambda i: DictTextNode(text, TextType.TEXT), lambda i: TextNode(text, TextType.TEXT)),
+        ("text leaf", lambda i: DictHTMLNode(None, text), lambda i: HTMLLeafNode(None, text)),
+        ("tagged leaf", lambda i: DictHTMLNode("b", text), lambda i: HTMLLeafNode("b", text)),
+        ("parent", lambda i: DictHTMLNode("p", None, []), lambda i: HTMLParentNode("p", [])),
+    ]
+    print(f"{'node':<12} {'before B':>9} {'after B':>8} {'saved':>6}")
+    for name, before_factory, after_factory in cases:
+        before = bytes_per_object(before_factory, args.count)
+        after = bytes_per_object(after_factory, args.count)
+        print(f"{name:<12} {before:>9.1f} {after:>8.1f} {1 - after / before:>6.0%}")
+    print(f"\nrendered page tree: {tree_bytes_per_node(200):.1f} bytes per node (including text)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Per-stage benchmark of the generator on synthetic corpora.
+
+Generates a corpus for each requested shape (see corpus.py) and times every
+stage of the pipeline on it separately: markdown_to_blocks on each page,
+block_to_block_type on each block, text_to_textnode on each paragraph,
+markdown_to_html_node on each page, to_html on the resulting trees, and a full
+generate_pages_recursive build into an empty directory. Each stage is timed
+best-of-N, with the N runs taking turns across all shapes and stages, and then run once more under tracemalloc for its peak memory, which
+covers Python allocations in this process only (not worker processes when
+--jobs is above 1). With --min-time, each of the N timings repeats the stage
+until it has run for that long and reports the mean time per call, so short
+stages are measured over more than a few milliseconds.
+
+Results are printed as JSON, or written to --output:
+
+    {"python": "3.12.1", "repeat": 3, "min_time": 0.0, "scale": 1.0, "jobs": 1, "shapes": {"small-pages": {
+        "corpus": {"pages": 400, "bytes": 823000, "seed": 0},
+        "stages": {"markdown_to_blocks": {"seconds": 0.01, "pages_per_s": 40000.0,
+                                          "mb_per_s": 78.5, "peak_kib": 120.0}, ...}}}}
+
+Usage:
+    python3 benchmarks/bench_stages.py [--shape NAME ...] [--scale F] [--repeat N] [--min-time S] [--jobs N] [--output FILE]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from corpus import SHAPES, generate_corpus  # noqa: E402
+from block_type import block_to_block_type, BlockType  # noqa: E402
+from generate_pages_recursive import generate_pages_recursive  # noqa: E402
+from markdown_to_blocks import markdown_to_blocks  # noqa: E402
+from markdown_to_html_node import markdown_to_html_node  # noqa: E402
+from text_to_textnode import text_to_textnode  # noqa: E402
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "template.html")
+
+STAGES = ("markdown_to_blocks", "block_to_block_type", "text_to_textnode", "markdown_to_html_node", "to_html",
+          "generate_pages_recursive")
+
+
+def best_time(func, repeat, setup=None, min_time=0.0):
+    """
+    Returns the best of `repeat` timings of `func`, in seconds per call.
+
+    Each timing calls `func` until at least `min_time` seconds have been spent
+    in it, running `setup` untimed before every call.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        calls = 0
+        elapsed = 0.0
+        while calls == 0 or elapsed < min_time:
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            elapsed += time.perf_counter() - start
+            calls += 1
+        best = min(best, elapsed / calls)
+    return best
+
+
+def peak_memory(func, setup=None):
+    """Returns the peak of traced allocations while `func` runs, in KiB."""
+    if setup is not None:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def read_corpus(content_dir):
+    pages = []
+    for root, dirs, files in os.walk(content_dir):
+        dirs.sort()
+        for file in sorted(files):
+            with open(os.path.join(root, file), encoding="utf-8") as f:
+                pages.append(f.read())
+    return pages
+
+
+def prepare_shape(shape, work_dir, scale, jobs, seed):
+    """
+    Generates one corpus and the stage cases that time it.
+
+    Returns:
+        tuple: (corpus, cases), the corpus entry of the JSON report and a list of
+        (stage, function, bytes of input, setup run untimed before each call).
+    """
+    content_dir = os.path.join(work_dir, shape)
+    pages = max(1, round(SHAPES[shape]["pages"] * scale))
+    total_bytes = generate_corpus(content_dir, shape, pages=pages, seed=seed)
+    markdown = read_corpus(content_dir)
+    blocks = [block for page in markdown for block in markdown_to_blocks(page)]
+    paragraphs = [block for block in blocks if block_to_block_type(block) == BlockType.PARAGRAPH]
+    trees = [markdown_to_html_node(page) for page in markdown]
+    dest_dir = os.path.join(work_dir, f"{shape}-public")
+
+    def clear_dest():
+        # Every build writes into an empty directory, as after --clean
+        shutil.rmtree(dest_dir, ignore_errors=True)
+
+    cases = [
+        ("markdown_to_blocks", lambda: [markdown_to_blocks(page) for page in markdown], total_bytes, None),
+        ("block_to_block_type", lambda: [block_to_block_type(block) for block in blocks],
+         sum(len(block.encode("utf-8")) for block in blocks), None),
+        ("text_to_textnode", lambda: [text_to_textnode(block) for block in paragraphs],
+         sum(len(block.encode("utf-8")) for block in paragraphs), None),
+        ("markdown_to_html_node", lambda: [markdown_to_html_node(page) for page in markdown], total_bytes, None),
+        ("to_html", lambda: [tree.to_html() for tree in trees], total_bytes, None),
+        ("generate_pages_recursive",
+         lambda: generate_pages_recursive(content_dir, TEMPLATE_PATH, dest_dir, jobs=jobs), total_bytes, clear_dest),
+    ]
+    return {"pages": pages, "bytes": total_bytes, "seed": seed}, cases
+
+
+def run(shapes, scale=1.0, repeat=3, jobs=1, seed=0, min_time=0.0):
+    """
+    Benchmarks `shapes` and returns the JSON report as a dict.
+    """
+    report = {"python": platform.python_version(), "repeat": repeat, "min_time": min_time, "scale": scale,
+              "jobs": jobs, "shapes": {}}
+    with tempfile.TemporaryDirectory() as work_dir:
+        prepared = {shape: prepare_shape(shape, work_dir, scale, jobs, seed) for shape in shapes}
+        # The repeats take turns across every shape and stage, so a burst of load on a
+        # busy machine slows one run of many stages rather than every run of one stage
+        best = {(shape, case[0]): float("inf") for shape, (_, cases) in prepared.items() for case in cases}
+        for _ in range(repeat):
+            for shape, (_, cases) in prepared.items():
+                for name, func, size, setup in cases:
+                    best[shape, name] = min(best[shape, name], best_time(func, 1, setup, min_time))
+
+        for shape, (corpus, cases) in prepared.items():
+            stages = {}
+            for name, func, size, setup in cases:
+                seconds = best[shape, name]
+                stages[name] = {
+                    "seconds": round(seconds, 9),
+                    "pages_per_s": round(corpus["pages"] / seconds, 1),
+                    "mb_per_s": round(size / (1 << 20) / seconds, 3),
+                    "peak_kib": round(peak_memory(func, setup), 1),
+                }
+                print(f"{shape:<13} {name:<25} {seconds * 1000:>9.1f} ms", file=sys.stderr)
+            report["shapes"][shape] = {"corpus": corpus, "stages": stages}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shape", action="append", choices=sorted(SHAPES),
+                        help="corpus shape to run; repeat for several (defaults to all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies each shape's page count")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per stage; the best is reported")
+    parser.add_argument("--min-time", type=float, default=0.0,
+                        help="seconds each timing run repeats the stage for; the mean per call is used")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for the full build")
+    parser.add_argument("--seed", type=int, default=0, help="seeds the corpus generator")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.shape or list(SHAPES), args.scale, args.repeat, args.jobs, args.seed, args.min_time)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Performance regression gate against a committed baseline.
+
+Runs the per-stage benchmark (bench_stages.py) on the synthetic corpora and
+compares every stage with benchmarks/baseline.json. Exits with status 1 if a
+stage got slower, or used more peak memory, than the baseline allows. Exits
+with status 2 if the baseline was recorded with different benchmark settings.
+
+Timings are only comparable on the same machine, so both the baseline and
+each run also time a fixed pure-Python calibration loop. Stage times are
+divided by the calibration time before they are compared, which cancels out
+most of the difference between a laptop and a CI runner. Every stage is
+repeated for at least MIN_TIME seconds per timing run, so even
+sub-millisecond stages are timed over a stretch long enough to average out
+scheduler noise, and the best of REPEAT runs is kept. The runs take turns
+across all shapes and stages, so a burst of load on a shared machine cannot
+slow every run of one stage. A stage is allowed to take `tolerance`
+longer than the baseline, plus `--min-seconds` of absolute slack for stages
+that only take microseconds. Peak memory barely varies between runs, so its
+tolerance is tighter still.
+
+After an intended change in performance, record a new baseline with --update
+and commit it.
+
+Usage:
+    python3 benchmarks/check_regressions.py [--tolerance F] [--memory-tolerance F] [--update]
+"""
+import argparse
+import json
+import os
+import sys
+
+from bench_stages import STAGES, best_time, run
+from corpus import SHAPES
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Settings of the benchmark run; a baseline only applies to runs with the same ones
+SCALE = 0.25
+REPEAT = 7
+MIN_TIME = 0.1
+SEED = 0
+
+
+def calibrate(repeat=REPEAT):
+    """Returns the best time of a fixed pure-Python workload, in seconds."""
+    def workload():
+        counts = {}
+        for i in range(200000):
+            word = str(i % 1000)
+            counts[word] = counts.get(word, 0) + len(word)
+        return "".join(sorted(counts))
+    return best_time(workload, repeat, min_time=MIN_TIME)
+
+
+def measure(jobs=1):
+    """Runs the benchmark and returns its report with the calibration time added."""
+    before = calibrate()
+    report = run(list(SHAPES), SCALE, REPEAT, jobs, SEED, MIN_TIME)
+    # Calibrated on both sides of the run, in case the machine was busy for one of them
+    report["calibration_seconds"] = round(min(before, calibrate()), 6)
+    return report
+
+
+def compare(baseline, report, tolerance, memory_tolerance, min_seconds):
+    """
+    Compares a benchmark report with the baseline.
+
+    Args:
+        baseline (dict): The committed report.
+        report (dict): The report of this run.
+        tolerance (float): Allowed relative slowdown, e.g. 0.25 for 25%.
+        memory_tolerance (float): Allowed relative growth of peak memory.
+        min_seconds (float): Absolute slack added to every time limit.
+
+    Returns:
+        tuple: (lines, regressions), one report line per stage and the lines of the
+        stages that regressed.
+    """
+    # How much faster or slower this machine is than the one that recorded the baseline
+    speed = report["calibration_seconds"] / baseline["calibration_seconds"]
+    lines = []
+    regressions = []
+    for shape, expected in baseline["shapes"].items():
+        for stage in STAGES:
+            before = expected["stages"][stage]
+            after = report["shapes"][shape]["stages"][stage]
+            limit = before["seconds"] * speed * (1 + tolerance) + min_seconds
+            memory_limit = before["peak_kib"] * (1 + memory_tolerance)
+            change = after["seconds"] / (before["seconds"] * speed) - 1
+            line = (f"{shape:<13} {stage:<25} {after['seconds'] * 1000:>9.1f} ms {change:>+7.0%}"
+                    f" {after['peak_kib']:>10.0f} KiB")
+            failures = []
+            if after["seconds"] > limit:
+                failures.append(f"slower than {limit * 1000:.1f} ms")
+            if after["peak_kib"] > memory_limit:
+                failures.append(f"more memory than {memory_limit:.0f} KiB")
+            if failures:
+                line += "  REGRESSION: " + ", ".join(failures)
+                regressions.append(line)
+            lines.append(line)
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare with or update")
+    parser.add_argument("--tolerance", type=float, default=0.35,
+                        help="allowed slowdown per stage (0.35 = 35%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2,
+                        help="allowed peak memory growth per stage (0.2 = 20%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.001,
+                        help="absolute slack added to every time limit")
+    parser.add_argument("--update", action="store_true", help="record this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    report = measure()
+    if args.update:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    settings = ("scale", "repeat", "min_time", "jobs")
+    if any(baseline.get(key) != report[key] for key in settings) or baseline["shapes"].keys() != report["shapes"].keys() \
+            or any(baseline["shapes"][shape]["corpus"] != report["shapes"][shape]["corpus"]
+                   for shape in baseline["shapes"]):
+        print("The baseline was recorded with different benchmark settings; re-record it with --update.",
+              file=sys.stderr)
+        return 2
+
+    lines, regressions = compare(baseline, report, args.tolerance, args.memory_tolerance, args.min_seconds)
+    print(f"Calibration: {report['calibration_seconds'] * 1000:.1f} ms "
+          f"(baseline {baseline['calibration_seconds'] * 1000:.1f} ms)")
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) regressed:\n" + "\n".join(regressions), file=sys.stderr)
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Synthetic markdown corpus generator for the benchmarks.
+
+Writes a content directory of generated pages in one of several shapes: many
+small pages, a few huge pages, or pages dominated by inline formatting, lists
+or code. The output only depends on the shape, sizes and seed, so two runs
+with the same arguments time the same input.
+
+Usage:
+    python3 benchmarks/corpus.py DEST [--shape NAME] [--pages N] [--page-kb N] [--seed N]
+"""
+import argparse
+import os
+import random
+
+WORDS = ("ring", "shire", "hobbit", "wizard", "elven", "mountain", "river", "road", "fellowship", "tower",
+         "king", "forest", "shadow", "light", "journey", "council", "sword", "song", "gate", "ancient")
+
+# Default page count, page size and block mix (relative weights) for each shape
+SHAPES = {
+    "small-pages": {"pages": 400, "page_kb": 2,
+                    "mix": {"paragraph": 4, "heading": 1, "list": 1, "quote": 1, "code": 1, "image": 1}},
+    "huge-pages": {"pages": 2, "page_kb": 2048,
+                   "mix": {"paragraph": 4, "heading": 1, "list": 1, "quote": 1, "code": 1, "image": 1}},
+    "inline-heavy": {"pages": 40, "page_kb": 32, "mix": {"inline": 6, "heading": 1}},
+    "list-heavy": {"pages": 40, "page_kb": 32, "mix": {"list": 4, "ordered": 2, "heading": 1}},
+    "code-heavy": {"pages": 40, "page_kb": 32, "mix": {"code": 5, "paragraph": 1, "heading": 1}},
+}
+
+
+def _words(rng, count):
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _inline(rng, count):
+    # A sentence with one inline element every few words
+    parts = []
+    for _ in range(count):
+        kind = rng.randrange(8)
+        word = rng.choice(WORDS)
+        if kind == 0:
+            parts.append(f"**{word}**")
+        elif kind == 1:
+            parts.append(f"_{word}_")
+        elif kind == 2:
+            parts.append(f"`{word}()`")
+        elif kind == 3:
+            parts.append(f"[{word}](/blog/{word})")
+        else:
+            parts.append(word)
+    return " ".join(parts) + "."
+
+
+def _block(kind, rng):
+    if kind == "paragraph":
+        return " ".join(_words(rng, rng.randint(6, 14)).capitalize() + "." for _ in range(rng.randint(2, 5)))
+    if kind == "inline":
+        return " ".join(_inline(rng, rng.randint(8, 16)) for _ in range(rng.randint(3, 6)))
+    if kind == "heading":
+        return "#" * rng.randint(2, 4) + " " + _words(rng, rng.randint(2, 5)).capitalize()
+    if kind == "list":
+        return "\n".join(f"- {_inline(rng, rng.randint(3, 8))}" for _ in range(rng.randint(3, 10)))
+    if kind == "ordered":
+        return "\n".join(f"{i}. {_words(rng, rng.randint(3, 8))}" for i in range(1, rng.randint(4, 11)))
+    if kind == "quote":
+        return "\n".join(f"> {_words(rng, rng.randint(5, 12))}" for _ in range(rng.randint(1, 4)))
+    if kind == "code":
+        lines = [f"    {rng.choice(WORDS)} = {rng.choice(WORDS)}({rng.randint(0, 99)})"
+                 for _ in range(rng.randint(3, 15))]
+        return "\n".join(["```python", f"def {rng.choice(WORDS)}():", *lines, "```"])
+    if kind == "image":
+        word = rng.choice(WORDS)
+        return f"![{word}](/images/{word}.png)"
+    raise ValueError(f"Unknown block kind: {kind}")
+
+
+def generate_page(rng, title, size, mix):
+    """
+    Generates one page of about `size` characters.
+
+    Args:
+        rng (random.Random): The source of randomness.
+        title (str): The text of the page's h1.
+        size (int): The number of characters to stop after.
+        mix (dict): Relative weights of the block kinds.
+
+    Returns:
+        str: The page's markdown.
+    """
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    blocks = [f"# {title}"]
+    length = len(blocks[0])
+    while length < size:
+        block = _block(rng.choices(kinds, weights)[0], rng)
+        blocks.append(block)
+        length += len(block) + 2
+    return "\n\n".join(blocks) + "\n"
+
+
+def generate_corpus(dest, shape="small-pages", pages=None, page_kb=None, seed=0):
+    """
+    Writes a synthetic corpus to `dest`, ten pages per section directory.
+
+    Args:
+        dest (str): The content directory to create.
+        shape (str): One of SHAPES.
+        pages (int): Overrides the shape's page count.
+        page_kb (int): Overrides the shape's page size in KiB.
+        seed (int): Seeds the generator.
+
+    Returns:
+        int: The total size of the written markdown in bytes.
+    """
+    spec = SHAPES[shape]
+    pages = spec["pages"] if pages is None else pages
+    page_kb = spec["page_kb"] if page_kb is None else page_kb
+    rng = random.Random(seed)
+    total = 0
+    for number in range(pages):
+        section = os.path.join(dest, f"section-{number // 10}")
+        os.makedirs(section, exist_ok=True)
+        markdown = generate_page(rng, f"{shape} page {number}", page_kb * 1024, spec["mix"])
+        with open(os.path.join(section, f"page-{number}.md"), "w", encoding="utf-8") as f:
+            f.write(markdown)
+        total += len(markdown.encode("utf-8"))
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("dest", help="content directory to write")
+    parser.add_argument("--shape", choices=sorted(SHAPES), default="small-pages")
+    parser.add_argument("--pages", type=int, help="number of pages (defaults to the shape's)")
+    parser.add_argument("--page-kb", type=int, help="size of each page in KiB (defaults to the shape's)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    total = generate_corpus(args.dest, args.shape, args.pages, args.page_kb, args.seed)
+    print(f"Wrote {total / (1 << 20):.1f} MiB of markdown to {args.dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+source .venv/bin/activate
+python3 benchmarks/check_regressions.py "$@"
@@ -0,0 +1,103 @@
+"""
+This module publishes a single static file into the output directory.
+
+Three modes are supported:
+
+    copy - a regular byte copy (shutil.copy2)
+    hardlink - a hard link to the source, so no bytes are duplicated on disk
+    reflink - a copy-on-write clone (FICLONE) where the filesystem supports it,
+              then an in-kernel copy_file_range, then a regular copy
+
+Hardlink and reflink fall back to a regular copy automatically when the
+filesystem or platform can't do them. The published file is always put in
+place with os.replace, so a hard-linked source is never written through.
+"""
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+COPY_MODES = ("copy", "hardlink", "reflink")
+
+# ioctl request number for FICLONE from <linux/fs.h>
+FICLONE = 0x40049409
+
+
+def _temp_path(dest_path):
+    return f"{dest_path}.publish-tmp"
+
+
+def _clone_into(src_file, dest_file):
+    """
+    Fills `dest_file` from `src_file` without going through userspace buffers
+    where possible. Returns the method that succeeded.
+    """
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dest_file.fileno(), FICLONE, src_file.fileno())
+            return "reflink"
+        except OSError:
+            pass
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src_file.fileno(), dest_file.fileno(), 1 << 30):
+                pass
+            return "copy_file_range"
+        except OSError:
+            # Start over with a plain copy if the kernel gave up part way
+            src_file.seek(0)
+            dest_file.seek(0)
+            dest_file.truncate()
+    shutil.copyfileobj(src_file, dest_file)
+    return "copy"
+
+
+def publish_file(src_path, dest_path, mode="copy"):
+    """
+    Publishes `src_path` at `dest_path`, replacing any existing file.
+
+    Args:
+        src_path (str): The static source file.
+        dest_path (str): Where it should appear in the output directory.
+        mode (str): One of COPY_MODES.
+
+    Returns:
+        str: The method actually used ("copy", "hardlink", "reflink" or
+        "copy_file_range"), which differs from `mode` after a fallback.
+
+    Raises:
+        ValueError: If mode is not one of COPY_MODES.
+    """
+    if mode not in COPY_MODES:
+        raise ValueError(f"Invalid copy mode: {mode}. Valid modes are: {', '.join(COPY_MODES)}")
+
+    tmp_path = _temp_path(dest_path)
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+
+    method = None
+    try:
+        if mode == "hardlink":
+            try:
+                os.link(src_path, tmp_path)
+                method = "hardlink"
+            except OSError:
+                pass  # Cross-device or unsupported; fall back to copying
+        elif mode == "reflink":
+            with open(src_path, 'rb') as src_file, open(tmp_path, 'wb') as dest_file:
+                method = _clone_into(src_file, dest_file)
+            shutil.copystat(src_path, tmp_path)
+
+        if method is None:
+            shutil.copy2(src_path, tmp_path)
+            method = "copy"
+
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return method
@@ -0,0 +1,38 @@
+"""
+This module resolves site-absolute URLs against the basepath the site is served from.
+
+When the site is published under a sub-path (e.g. GitHub Pages serving
+/python-static-site-generator/), a link written as /blog/tom must point at
+/python-static-site-generator/blog/tom. The rewrite is applied to href and src
+attributes as the HTML tree and template are built, rather than by searching
+the finished document.
+"""
+import re
+
+# href="/... or src="/... in template markup, but not protocol-relative //host URLs
+TEMPLATE_URL_PATTERN = re.compile(r'\b(href|src)="/(?!/)')
+
+
+def apply_basepath(url, basepath="/"):
+    """
+    Prefixes a site-absolute URL with the basepath.
+
+    Args:
+        url (str): The URL as written in the markdown or template.
+        basepath (str): The site root, e.g. "/" or "/repo/".
+
+    Returns:
+        str: The resolved URL. Relative, external and protocol-relative URLs are unchanged.
+    """
+    if basepath == "/" or not url.startswith("/") or url.startswith("//"):
+        return url
+    return basepath + url[1:]
+
+
+def apply_basepath_to_markup(markup, basepath="/"):
+    """
+    Resolves href="/..." and src="/..." attributes in literal template markup.
+    """
+    if basepath == "/":
+        return markup
+    return TEMPLATE_URL_PATTERN.sub(lambda match: f'{match.group(1)}="{basepath}', markup)
@@ -0,0 +1,164 @@
+"""
+This module defines the cross-page block render cache.
+
+Pages often repeat whole markdown blocks: notices, code samples, footers. The
+cache maps a hash of a block's text, the basepath and the generator version to
+the HTML that block renders to and its PageInfo summary, so a repeated block is
+neither classified, tokenized nor rendered again. It is a bounded LRU and can be saved to disk so
+later builds start warm.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from build_manifest import GENERATOR_VERSION
+
+CACHE_FORMAT = 2
+
+DEFAULT_MAXSIZE = 4096
+
+
+class BlockCache:
+    """
+    Initialize a BlockCache instance.
+
+    Values are whatever the renderer stores per block; they must be JSON
+    serializable for save().
+
+    :param maxsize: The most blocks kept; the least recently used are evicted first
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Entries added since the last take_delta(), or None unless this is a
+        # worker's copy; the parent's cache must stay bounded by maxsize
+        self._added = None
+
+    @staticmethod
+    def key(block, basepath="/", variant=""):
+        """
+        Returns the cache key for a block rendered with `basepath`.
+
+        The generator version is part of the key, so entries rendered by an
+        older renderer are never reused. `variant` distinguishes renderers
+        within one version, e.g. the block handler registry's fingerprint.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{GENERATOR_VERSION}\0{basepath}\0{variant}\0".encode('utf-8'))
+        digest.update(block.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Returns the value cached under `key` and marks it recently used, or None.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Caches `value` under `key`, evicting the least recently used entry if full."""
+        self._store(key, value)
+        if self._added is not None:
+            self._added.append((key, value))
+
+    def _store(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def track_delta(self):
+        """Starts recording added entries for take_delta(); done in worker copies."""
+        if self._added is None:
+            self._added = []
+
+    def take_delta(self):
+        """
+        Returns and resets what changed since the last call.
+
+        Worker processes render with their own copy of the cache; the parent
+        merges each worker's delta into its own cache with merge(). Entries are
+        only recorded after track_delta(), which unpickled copies call themselves.
+
+        Returns:
+            tuple: (entries, hits, misses), where entries is a list of (key, value).
+        """
+        delta = (self._added or [], self.hits, self.misses)
+        if self._added is not None:
+            self._added = []
+        self.hits = 0
+        self.misses = 0
+        return delta
+
+    def merge(self, delta):
+        """Folds a delta from take_delta() into this cache."""
+        entries, hits, misses = delta
+        for key, value in entries:
+            self._store(key, value)
+        self.hits += hits
+        self.misses += misses
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # Workers receive the entries but start with fresh counters
+        return {"maxsize": self.maxsize, "entries": list(self._entries.items())}
+
+    def __setstate__(self, state):
+        self.__init__(state["maxsize"])
+        self._entries.update(state["entries"])
+        # Only worker processes receive pickled copies
+        self.track_delta()
+
+    def __repr__(self):
+        return f"BlockCache(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+    @classmethod
+    def load(cls, path, maxsize=DEFAULT_MAXSIZE):
+        """
+        Loads a cache saved with save(), or returns an empty one.
+
+        A missing or unreadable file, or one written by another generator
+        version, just means starting cold.
+        """
+        cache = cls(maxsize)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cache
+        if (not isinstance(data, dict)
+                or data.get("format") != CACHE_FORMAT
+                or data.get("version") != GENERATOR_VERSION
+                or not isinstance(data.get("entries"), list)):
+            return cache
+        # Entries are saved oldest first, so the most recent ones survive a smaller maxsize
+        for key, value in data["entries"]:
+            cache._store(key, value)
+        return cache
+
+    def save(self, path):
+        """Writes the cache atomically, least recently used entry first."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "format": CACHE_FORMAT,
+            "version": GENERATOR_VERSION,
+            "entries": list(self._entries.items()),
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
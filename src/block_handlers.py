@@ -0,0 +1,280 @@
+"""
+This module defines the block handler registry used by markdown_to_html_node.
+
+Every kind of markdown block is rendered by a handler object registered under
+its block type. The built-in handlers cover the BlockType members and are
+registered once at import in BLOCK_HANDLERS. New block types (tables,
+admonitions, ...) are added by registering a handler that overrides detect():
+
+    class NoteHandler(BlockHandler):
+        block_type = "note"
+
+        def detect(self, block):
+            return block.startswith("!!! note")
+
+        def render(self, info, basepath, debug):
+            return HTMLParentNode.trusted("aside", inline_to_html_nodes(info.block[9:], basepath))
+
+    register_block_handler(NoteHandler())
+
+Handlers with a detect() method are tried in registration order before the
+built-in classification. Built-in handlers render from the BlockInfo that
+classify_block returns, without parsing the block again. Each handler counts
+its calls and the time spent in them.
+"""
+import logging
+import re
+import time
+from htmlnode import HTMLParentNode, HTMLLeafNode
+from block_type import classify_block, BlockInfo, BlockType
+from converter import text_node_to_html_node
+from slugs import slugify
+from textnode import TextNode, TextType
+from basepath import apply_basepath
+from inline_markdown import inline_to_html_nodes
+
+logger = logging.getLogger(__name__)
+
+IMAGE_BLOCK_PATTERN = re.compile(r'!\[(.*?)\]\((.*?)\)')
+
+
+class BlockHandler:
+    """
+    Base class for block handlers.
+
+    Subclasses set block_type and implement render(). Handlers for block types
+    the built-in classifier doesn't know also implement detect(). Bump version
+    when a handler's output changes so cached blocks are not reused.
+
+    :param calls: How many blocks this handler has rendered
+    :param seconds: Total time spent in render()
+    """
+
+    block_type = None
+    version = "1"
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+
+    def detect(self, block):
+        """Returns True if this handler renders `block`. Only consulted for custom block types."""
+        return False
+
+    def render(self, info, basepath, debug):
+        """
+        Renders one block.
+
+        Args:
+            info (BlockInfo): The classified block. info.block holds its markdown; custom
+                block types get only block_type and block filled in.
+            basepath (str): The site root that absolute link and image URLs are resolved against.
+            debug (bool): Whether debug logging is enabled.
+
+        Returns:
+            HTMLNode: The rendered block.
+        """
+        raise NotImplementedError("render method is not implemented")
+
+    def __repr__(self):
+        return f"{type(self).__name__}(block_type={self.block_type}, calls={self.calls})"
+
+
+class ParagraphHandler(BlockHandler):
+    block_type = BlockType.PARAGRAPH
+
+    def render(self, info, basepath, debug):
+        return HTMLParentNode.trusted(tag="p", children=inline_to_html_nodes(info.block, basepath))
+
+
+class HeadingHandler(BlockHandler):
+    block_type = BlockType.HEADING
+
+    def render(self, info, basepath, debug):
+        # The id is the plain slug; render_block makes it unique within the page
+        children = inline_to_html_nodes(info.text, basepath)
+        heading = HTMLParentNode.trusted(tag=f"h{info.level}", children=children)
+        heading.props = {"id": slugify(heading.text_content().partition("\n")[0])}
+        return heading
+
+
+class CodeHandler(BlockHandler):
+    block_type = BlockType.CODE
+
+    def render(self, info, basepath, debug):
+        # Code is neither parsed for inline markdown nor rewritten for the basepath
+        if debug:
+            logger.debug("Code content: %s", info.text)
+        props = {"class": f"language-{info.language}"} if info.language is not None else None
+        code_node = HTMLLeafNode.trusted(tag="code", value=info.text, props=props)
+        return HTMLParentNode.trusted(tag="pre", children=[code_node])
+
+
+class QuoteHandler(BlockHandler):
+    block_type = BlockType.QUOTE
+
+    def render(self, info, basepath, debug):
+        if debug:
+            logger.debug("Processed blockquote content: %s", info.text)
+        return HTMLParentNode.trusted(tag="blockquote", children=inline_to_html_nodes(info.text, basepath))
+
+
+class ListHandler(BlockHandler):
+    """
+    Renders unordered and ordered lists, one <li> per line.
+
+    :param block_type: BlockType.UNORDERED_LIST or BlockType.ORDERED_LIST
+    """
+
+    def __init__(self, block_type: BlockType):
+        super().__init__()
+        self.block_type = block_type
+        self.tag = "ul" if block_type == BlockType.UNORDERED_LIST else "ol"
+
+    def render(self, info, basepath, debug):
+        list_children = []
+        # The classifier has already removed the list markers
+        for item in info.items:
+            item_children = inline_to_html_nodes(item, basepath)
+            if debug:
+                logger.debug("Adding list item nodes: %s", item_children)
+            list_children.append(HTMLParentNode.trusted(tag="li", children=item_children))
+        return HTMLParentNode.trusted(tag=self.tag, children=list_children)
+
+
+class ImageHandler(BlockHandler):
+    block_type = BlockType.IMAGE
+
+    def render(self, info, basepath, debug):
+        match = IMAGE_BLOCK_PATTERN.match(info.block)
+        if match:
+            alt_text, img_url = match.groups()
+            return HTMLLeafNode.trusted(
+                tag="img", props={"src": apply_basepath(img_url, basepath), "alt": alt_text})
+        return HTMLParentNode.trusted(tag="p", children=[
+            text_node_to_html_node(TextNode(info.block, TextType.TEXT))])
+
+
+class FallbackHandler(BlockHandler):
+    """Renders blocks whose type has no handler as plain text in a <div>."""
+
+    block_type = "fallback"
+
+    def render(self, info, basepath, debug):
+        return HTMLParentNode.trusted(tag="div", children=[
+            text_node_to_html_node(TextNode(info.block, TextType.TEXT))])
+
+
+class BlockHandlerRegistry:
+    """
+    Initialize a BlockHandlerRegistry instance.
+
+    :param fallback: The handler for blocks whose type has no registered handler
+    """
+
+    def __init__(self, fallback: BlockHandler = None):
+        self.fallback = fallback if fallback is not None else FallbackHandler()
+        self._handlers = {}
+        self._detecting = []
+        self.fingerprint = ""
+
+    def register(self, handler):
+        """
+        Registers `handler` for its block_type, replacing any handler already there.
+
+        A handler that overrides detect() is tried before the built-in
+        classification, after the detecting handlers registered before it.
+        """
+        if handler.block_type is None:
+            raise ValueError("A block handler needs a block_type.")
+        previous = self._handlers.get(handler.block_type)
+        if previous in self._detecting:
+            self._detecting.remove(previous)
+        self._handlers[handler.block_type] = handler
+        if type(handler).detect is not BlockHandler.detect:
+            self._detecting.append(handler)
+        # Identifies the registered renderers, so block caches don't mix outputs
+        self.fingerprint = ";".join(
+            f"{block_type}={type(h).__qualname__}:{h.version}" for block_type, h in self._handlers.items())
+
+    def handler_for(self, block):
+        """Returns the handler that renders `block`."""
+        return self.classify(block)[0]
+
+    def classify(self, block):
+        """
+        Returns the handler for `block` and the BlockInfo it renders from.
+        """
+        for handler in self._detecting:
+            if handler.detect(block):
+                return handler, BlockInfo(handler.block_type, block)
+        info = classify_block(block)
+        return self._handlers.get(info.block_type, self.fallback), info
+
+    def render(self, block, basepath="/", debug=False):
+        """
+        Renders `block` with its handler, recording the call and its duration.
+
+        Returns:
+            HTMLNode: The rendered block. Parent nodes always have at least one child.
+        """
+        return self.render_info(block, basepath, debug)[0]
+
+    def render_info(self, block, basepath="/", debug=False):
+        """
+        Like render(), but also returns the BlockInfo the block was rendered from.
+
+        Returns:
+            tuple: (HTMLNode, BlockInfo)
+        """
+        handler, info = self.classify(block)
+        if debug:
+            logger.debug("Processing block: %s... identified as %s", block[:30], info.block_type)
+        start = time.perf_counter()
+        html_node = handler.render(info, basepath, debug)
+        handler.seconds += time.perf_counter() - start
+        handler.calls += 1
+
+        if not html_node.children and html_node.tag != "img" and html_node.value is None:
+            # Ensure parent nodes have at least one child
+            html_node.children.append(text_node_to_html_node(TextNode("", TextType.TEXT)))
+        if debug:
+            logger.debug("Rendered block: %s", html_node.to_html())
+        return html_node, info
+
+    def stats(self):
+        """
+        Returns the call count and total time of every handler that has run.
+
+        Returns:
+            dict: Mapping of block type to {"calls": int, "seconds": float}.
+        """
+        handlers = list(self._handlers.values()) + [self.fallback]
+        return {
+            handler.block_type: {"calls": handler.calls, "seconds": handler.seconds}
+            for handler in handlers if handler.calls
+        }
+
+    def reset_stats(self):
+        for handler in list(self._handlers.values()) + [self.fallback]:
+            handler.calls = 0
+            handler.seconds = 0.0
+
+
+def default_registry():
+    """Returns a new registry holding only the built-in handlers."""
+    registry = BlockHandlerRegistry()
+    for handler in (ParagraphHandler(), HeadingHandler(), CodeHandler(), QuoteHandler(),
+                    ListHandler(BlockType.UNORDERED_LIST), ListHandler(BlockType.ORDERED_LIST),
+                    ImageHandler()):
+        registry.register(handler)
+    return registry
+
+
+# The registry markdown_to_html_node uses unless given another
+BLOCK_HANDLERS = default_registry()
+
+
+def register_block_handler(handler):
+    """Registers `handler` with the default registry, BLOCK_HANDLERS."""
+    BLOCK_HANDLERS.register(handler)
@@ -10,38 +10,97 @@ class BlockType(Enum):
     IMAGE = "image"
 
 
-def block_to_block_type(block: str) -> BlockType:
-    if not block.strip():
-        return BlockType.PARAGRAPH
+class BlockInfo:
+    """
+    The result of classifying a block, parsed far enough to render it directly.
 
-    lines = block.splitlines()
+    :param block_type: The BlockType (or a custom handler's block type)
+    :param block: The block's markdown text
+    :param level: The heading level, 1-6, for headings
+    :param text: The heading text, the quote text without '>' markers, or the code inside the fences
+    :param items: The list item texts without their '- ' or 'N. ' markers
+    :param language: The info string after the opening code fence, e.g. "python"
+    """
+
+    __slots__ = ("block_type", "block", "level", "text", "items", "language")
 
-    # Check for heading
-    if lines[0].startswith(tuple(f"{'#' * i} " for i in range(1, 7))):
-        return BlockType.HEADING
+    def __init__(self, block_type, block: str, level: int = None, text: str = None, items: list = None,
+                 language: str = None):
+        self.block_type = block_type
+        self.block = block
+        self.level = level
+        self.text = text
+        self.items = items
+        self.language = language
 
-    # Check for code block
-    if block.startswith("```") and block.endswith("```"):
-        return BlockType.CODE
+    def __eq__(self, other):
+        if not isinstance(other, BlockInfo):
+            return False
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
 
-    # Refine quote block detection
-    if any(line.startswith(">") for line in lines):
-        return BlockType.QUOTE
+    def __repr__(self):
+        return (f"BlockInfo({self.block_type}, level={self.level}, text={self.text!r}, items={self.items}, "
+                f"language={self.language!r})")
 
-    # Check for unordered list block
-    if all(line.startswith("- ") for line in lines):
-        return BlockType.UNORDERED_LIST
 
-    # Check for ordered list block
-    try:
-        if all(line.startswith(f"{i}. ") for i, line in enumerate(lines, start=1)):
-            return BlockType.ORDERED_LIST
-    except ValueError:
-        pass
+def classify_block(block: str) -> BlockInfo:
+    """
+    Classifies a block in a single scan of its lines.
+
+    Headings and code fences are recognised from the first character; every
+    other block is classified in one pass that tracks the quote and list
+    conditions together. The precedence is unchanged: heading, code, quote
+    (any line starting with '>'), unordered list, ordered list, image,
+    paragraph.
+
+    Args:
+        block (str): The markdown block.
+
+    Returns:
+        BlockInfo: The block type and what the renderer needs from the block.
+    """
+    if not block.strip():
+        return BlockInfo(BlockType.PARAGRAPH, block)
+
+    first = block[0]
+    if first == "#":
+        level = len(block) - len(block.lstrip("#"))
+        if level <= 6 and block[level:level + 1] == " ":
+            return BlockInfo(BlockType.HEADING, block, level=level, text=block[level:].strip())
+    elif first == "`" and block.startswith("```") and block.endswith("```"):
+        language = None
+        text = block.strip("`\n")
+        newline = block.find("\n")
+        if newline != -1:
+            info = block[3:newline].strip("` ")
+            if info:
+                # The opening fence carries an info string, not code
+                language = info
+                text = block[newline:].strip("`\n")
+        return BlockInfo(BlockType.CODE, block, text=text, language=language)
+
+    lines = block.splitlines()
+    is_unordered = is_ordered = True
+    for number, line in enumerate(lines, start=1):
+        if line[:1] == ">":
+            quote_text = '\n'.join(line.lstrip('> ').strip() for line in lines if line.startswith('>'))
+            return BlockInfo(BlockType.QUOTE, block, text=quote_text)
+        if is_unordered and not line.startswith("- "):
+            is_unordered = False
+        if is_ordered and not line.startswith(f"{number}. "):
+            is_ordered = False
+
+    if is_unordered:
+        return BlockInfo(BlockType.UNORDERED_LIST, block, items=[line[2:].strip() for line in lines])
+    if is_ordered:
+        return BlockInfo(BlockType.ORDERED_LIST, block,
+                         items=[line[len(str(number)) + 2:].strip() for number, line in enumerate(lines, start=1)])
 
-    # Check for image block
     if block.startswith("![") and block.endswith(")"):
-        return BlockType.IMAGE
+        return BlockInfo(BlockType.IMAGE, block)
 
-    # Default to paragraph
-    return BlockType.PARAGRAPH
\ No newline at end of file
+    return BlockInfo(BlockType.PARAGRAPH, block)
+
+
+def block_to_block_type(block: str) -> BlockType:
+    return classify_block(block).block_type
@@ -0,0 +1,175 @@
+"""
+This module keeps the build manifest used for incremental builds.
+
+The manifest is a JSON file recording, for every generated page, the inputs that
+produced it: the hash of its markdown source, the hash of the template, the
+basepath and the generator version. A page only needs re-rendering when one of
+those inputs changed or its output file went missing.
+
+It also keeps each page's PageInfo metadata (title, headings, word count, links,
+images), so later stages can use it without re-reading or re-parsing pages that
+were up to date.
+"""
+import hashlib
+import json
+import os
+from page_info import PageInfo
+
+# Bump whenever a change to the renderer alters the generated HTML so that
+# every page is rebuilt on the next incremental build.
+GENERATOR_VERSION = "8"
+
+MANIFEST_FORMAT = 1
+
+
+def hash_file(path):
+    """
+    Returns the SHA-256 hex digest of a file's contents.
+
+    Args:
+        path (str): The file to hash.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def prune_empty_dirs(directory, stop_dir):
+    """
+    Removes `directory` and its parents while they are empty, stopping at `stop_dir`.
+    """
+    stop_dir = os.path.normpath(stop_dir)
+    while os.path.normpath(directory) != stop_dir and os.path.isdir(directory):
+        if os.listdir(directory):
+            break
+        os.rmdir(directory)
+        directory = os.path.dirname(directory)
+
+
+def page_inputs(source_hash, template_hash, basepath):
+    """
+    Builds the manifest record describing everything a page's output depends on.
+
+    Args:
+        source_hash (str): Hash of the page's markdown source.
+        template_hash (str): Hash of the template source (Template.source_hash).
+        basepath (str): The basepath the page is rendered with.
+    """
+    return {
+        "source": source_hash,
+        "template": template_hash,
+        "basepath": basepath,
+        "version": GENERATOR_VERSION,
+    }
+
+
+class BuildManifest:
+    """
+    Initialize a BuildManifest instance.
+
+    :param path: Where the manifest JSON is stored
+    :param content_dir: The content directory the pages are generated from
+    :param dest_dir: The output directory the pages are written to
+    :param pages: Mapping of output path (relative to dest_dir) to its recorded inputs
+    :param metadata: Mapping of output path (relative to dest_dir) to its PageInfo.to_dict()
+    """
+
+    def __init__(self, path: str, content_dir: str, dest_dir: str, pages: dict = None, metadata: dict = None):
+        self.path = path
+        self.content_dir = os.path.normpath(content_dir)
+        self.dest_dir = os.path.normpath(dest_dir)
+        self.pages = pages if pages is not None else {}
+        self.metadata = metadata if metadata is not None else {}
+
+    @classmethod
+    def load(cls, path, content_dir, dest_dir):
+        """
+        Loads the manifest at `path`, or returns an empty one.
+
+        A missing or unreadable manifest, or one written for a different
+        content/output directory pair, simply means every page is rebuilt.
+        """
+        manifest = cls(path, content_dir, dest_dir)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+        if (not isinstance(data, dict)
+                or data.get("format") != MANIFEST_FORMAT
+                or data.get("content_dir") != manifest.content_dir
+                or data.get("dest_dir") != manifest.dest_dir
+                or not isinstance(data.get("pages"), dict)):
+            return manifest
+        manifest.pages = data["pages"]
+        if isinstance(data.get("metadata"), dict):
+            manifest.metadata = data["metadata"]
+        return manifest
+
+    def save(self):
+        """Writes the manifest atomically so an interrupted build never leaves it half written."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "format": MANIFEST_FORMAT,
+            "content_dir": self.content_dir,
+            "dest_dir": self.dest_dir,
+            "pages": self.pages,
+            "metadata": self.metadata,
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def key(self, dest_path):
+        """Returns the manifest key for an output path."""
+        return os.path.relpath(dest_path, self.dest_dir).replace(os.sep, '/')
+
+    def is_up_to_date(self, dest_path, inputs):
+        """
+        Checks whether the output at `dest_path` was built from exactly `inputs`.
+        """
+        return self.pages.get(self.key(dest_path)) == inputs and os.path.exists(dest_path)
+
+    def record(self, dest_path, inputs, metadata=None):
+        """Records the inputs a freshly written output was built from, and its metadata."""
+        key = self.key(dest_path)
+        self.pages[key] = inputs
+        if metadata is not None:
+            self.metadata[key] = metadata
+
+    def page_info(self, dest_path):
+        """
+        Returns the recorded PageInfo for an output path, or None if there is none.
+        """
+        metadata = self.metadata.get(self.key(dest_path))
+        return PageInfo.from_dict(metadata) if metadata is not None else None
+
+    def remove_stale(self, current_dest_paths):
+        """
+        Deletes outputs whose markdown source no longer exists.
+
+        Args:
+            current_dest_paths (iterable): Output paths planned for this build.
+
+        Returns:
+            list: The output paths that were removed.
+        """
+        current = {self.key(dest_path) for dest_path in current_dest_paths}
+        removed = []
+        for key in sorted(set(self.pages) - current):
+            dest_path = os.path.join(self.dest_dir, *key.split('/'))
+            if os.path.exists(dest_path):
+                os.remove(dest_path)
+                prune_empty_dirs(os.path.dirname(dest_path), self.dest_dir)
+            del self.pages[key]
+            self.metadata.pop(key, None)
+            removed.append(dest_path)
+        return removed
@@ -0,0 +1,124 @@
+"""
+This module renders very large markdown documents in parallel.
+
+A document is cut into chunks of whole blocks, as scanned by
+iter_markdown_blocks, so no chunk boundary ever falls inside a block or a
+code fence. Each chunk is rendered to an HTML string in a worker process and
+the strings are stitched back together in document order. The parent never
+builds the document's node tree, and only a bounded number of chunks are in
+flight at a time.
+
+Heading ids are only made unique in the parent: workers render each heading
+with its plain slug, and the parent rewrites the repeats as it stitches the
+chunks together, using the heading list every chunk returns.
+
+Workers render with the block handlers registered in their own process, so
+custom handlers must be registered at import time of a module the workers
+also import (or the workers must be forked after registering them).
+"""
+import logging
+from collections import deque
+from htmlnode import HTMLParentNode, HTMLRawNode
+from markdown_to_blocks import iter_markdown_blocks
+from markdown_to_html_node import render_block
+from page_info import PageInfo
+from slugs import SlugSet, reassign_heading_ids
+
+logger = logging.getLogger(__name__)
+
+# Documents at least this large (in bytes of markdown) are rendered in chunks
+DEFAULT_CHUNK_THRESHOLD = 4 << 20
+
+# Roughly how much markdown goes into one chunk
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def iter_block_chunks(markdown, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Groups the blocks of a document into chunks of about `chunk_size` characters.
+
+    Args:
+        markdown (str | file): The markdown text, or a text file object to read it from.
+        chunk_size (int): The chunk size to aim for; a chunk is closed once it reaches it.
+
+    Yields:
+        list: Consecutive (line_number, block) pairs.
+    """
+    chunk = []
+    size = 0
+    for line_number, block in iter_markdown_blocks(markdown):
+        chunk.append((line_number, block))
+        size += len(block)
+        if size >= chunk_size:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def _render_chunk(chunk, basepath, slugs=None):
+    debug = logger.isEnabledFor(logging.DEBUG)
+    # Always collected: the parent needs the headings to de-duplicate their ids
+    page_info = PageInfo()
+    parts = []
+    for line_number, block in chunk:
+        render_block(block, line_number, basepath, debug=debug, page_info=page_info,
+                     slugs=slugs)._serialize(parts.append)
+    return "".join(parts), page_info
+
+
+def markdown_to_html_node_chunked(markdown, executor, basepath="/", chunk_size=DEFAULT_CHUNK_SIZE,
+                                  workers=1, max_pending=None, page_info=None):
+    """
+    Converts a markdown document into a parent HTMLNode, rendering chunks in `executor`.
+
+    The result serializes to the same HTML as markdown_to_html_node's, but its
+    children are one HTMLRawNode per chunk.
+
+    Args:
+        markdown (str | file): The markdown document, or a text file object to read it from.
+        executor (concurrent.futures.Executor): Where the chunks are rendered.
+        basepath (str): The site root that absolute link and image URLs are resolved against.
+        chunk_size (int): Roughly how many characters of markdown go into one chunk.
+        workers (int): How many workers `executor` runs.
+        max_pending (int): The most chunks submitted but not yet collected; defaults to
+            twice `workers`.
+        page_info (PageInfo): If given, filled with the page's metadata from every chunk.
+
+    Returns:
+        HTMLParentNode: A div holding the rendered chunks in document order.
+
+    Raises:
+        MarkdownRenderError: If a block fails to render.
+    """
+    if max_pending is None:
+        max_pending = 2 * workers
+    parent_node = HTMLParentNode.trusted(tag="div", children=[])
+    pending = deque()
+    slugs = SlugSet()
+
+    def collect(future, chunk):
+        html, chunk_info = future.result()
+        try:
+            html, chunk_info.headings = reassign_heading_ids(html, chunk_info.headings, slugs)
+        except ValueError:
+            # A heading tag can't be rewritten in place, so render the chunk here with the page's ids
+            html, chunk_info = _render_chunk(chunk, basepath, slugs)
+        parent_node.children.append(HTMLRawNode(html))
+        if page_info is not None:
+            page_info.merge(chunk_info)
+
+    try:
+        for chunk in iter_block_chunks(markdown, chunk_size):
+            pending.append((executor.submit(_render_chunk, chunk, basepath), chunk))
+            if len(pending) >= max_pending:
+                collect(*pending.popleft())
+        while pending:
+            collect(*pending.popleft())
+    except BaseException:
+        # Don't leave the rest of a failed document queued in the executor
+        for future, _ in pending:
+            future.cancel()
+        raise
+    return parent_node
@@ -3,18 +3,56 @@ This module contains a function that converts a TextNode to an HTMLLeafNode.
 It handles different types of text nodes and raises exceptions for invalid types.
 It imports the HTMLLeafNode class from the htmlnode module and the TextNode class and TextType enum from the textnode module.
 It is designed to be used in a larger application that deals with HTML generation and text formatting.
+The leaves are built with HTMLLeafNode.trusted, since the converter itself guarantees their shape.
+
+The per-type conversion is looked up in LEAF_BUILDERS, which is built once at
+import, so a conversion is one dict lookup and one constructor call.
 """
 from htmlnode import HTMLLeafNode
 from textnode import TextNode, TextType
+from basepath import apply_basepath
 import logging
 
+logger = logging.getLogger(__name__)
+
+
+def _tag_builder(tag):
+    def build(text, url, basepath):
+        return HTMLLeafNode.trusted(tag, text)
+    return build
+
+
+def _build_link(text, url, basepath):
+    return HTMLLeafNode.trusted("a", text, {"href": apply_basepath(str(url), basepath)})
+
+
+def _build_image(text, url, basepath):
+    return HTMLLeafNode.trusted("img", "", {"alt": str(text), "src": apply_basepath(str(url), basepath)})
+
+
+# Maps each TextType to a function(text, url, basepath) that builds its leaf
+LEAF_BUILDERS = {
+    TextType.TEXT: _tag_builder(None),  # No tag for plain text
+    TextType.BOLD: _tag_builder("b"),
+    TextType.ITALIC: _tag_builder("i"),
+    TextType.CODE: _tag_builder("code"),
+    TextType.LINK: _build_link,
+    TextType.IMAGE: _build_image,
+}
+
+
+def _invalid_type(text_type):
+    valid_types = ", ".join([t.name for t in TextType])
+    return ValueError(f"Invalid TextType: {text_type}. Valid types are: {valid_types}")
 
-def text_node_to_html_node(text_node: TextNode) -> HTMLLeafNode:
+
+def text_node_to_html_node(text_node: TextNode, basepath: str = "/") -> HTMLLeafNode:
     """
     Converts a TextNode to an HTMLLeafNode based on its TextType.
 
     Args:
         text_node (TextNode): The TextNode to convert.
+        basepath (str): The site root that absolute link and image URLs are resolved against.
 
     Returns:
         HTMLLeafNode: The corresponding HTMLLeafNode representation.
@@ -22,25 +60,36 @@ def text_node_to_html_node(text_node: TextNode) -> HTMLLeafNode:
     Raises:
         ValueError: If the TextNode has an invalid TextType.
     """
-    tag_mapping = {
-        TextType.TEXT: (None, text_node.text, None),  # No tag for plain text
-        TextType.BOLD: ("b", text_node.text, None),
-        TextType.ITALIC: ("i", text_node.text, None),
-        TextType.CODE: ("code", text_node.text, None),
-        TextType.LINK: ("a", text_node.text, {"href": str(text_node.url)}),
-        TextType.IMAGE: ("img", "", {"alt": str(text_node.text), "src": str(text_node.url)}),
-    }
-
-    logging.debug(
-        "Converting TextNode: %s with TextType: %s", str(text_node), str(text_node.text_type))
-    if text_node.text_type in tag_mapping:
-        tag, value, props = tag_mapping[text_node.text_type]
-        logging.debug("Mapped TextType: %s to tag: %s",
-                      str(text_node.text_type), str(tag))
-        # Ensure all keys and values in props are strings
-        if props is not None:
-            props = {str(k): str(v) for k, v in props.items()}
-        return HTMLLeafNode(tag, value, props)
-    else:
-        valid_types = ", ".join([t.name for t in TextType])
-        raise ValueError(f"Invalid TextType: {text_node.text_type}. Valid types are: {valid_types}")
+    build = LEAF_BUILDERS.get(text_node.text_type)
+    if build is None:
+        raise _invalid_type(text_node.text_type)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Converting TextNode: %s with TextType: %s", text_node, text_node.text_type)
+    return build(text_node.text, text_node.url, basepath)
+
+
+def text_nodes_to_html_nodes(text_nodes, basepath: str = "/") -> list:
+    """
+    Converts a run of TextNodes, such as the output of text_to_textnode, in one call.
+
+    Args:
+        text_nodes (iterable): The TextNodes to convert.
+        basepath (str): The site root that absolute link and image URLs are resolved against.
+
+    Returns:
+        list: The HTMLLeafNodes, in the same order.
+
+    Raises:
+        ValueError: If a TextNode has an invalid TextType.
+    """
+    builders = LEAF_BUILDERS
+    html_nodes = []
+    append = html_nodes.append
+    for text_node in text_nodes:
+        build = builders.get(text_node.text_type)
+        if build is None:
+            raise _invalid_type(text_node.text_type)
+        append(build(text_node.text, text_node.url, basepath))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Converted %d TextNodes", len(html_nodes))
+    return html_nodes
@@ -1,6 +1,57 @@
 # extractor.py
+"""
+Extracts markdown images and links.
+
+The patterns are compiled once at import and written so that matching never
+backtracks more than a constant amount per character: bracketed text is
+"anything but brackets, then balanced [...] groups", with no two ways of
+consuming the same character, and URLs are built the same way from parentheses,
+so "https://en.wikipedia.org/wiki/Foo_(bar)" is one URL. Scanning
+is therefore linear even on adversarial input such as long runs of "[".
+
+iter_markdown_images and iter_markdown_links yield the re.Match objects, so
+callers can slice the source with match.start() and match.end() instead of
+searching for each match again.
+"""
 import re
 
+# Text inside [...] allowing one level of nested brackets, e.g. "alt [nested]"
+BRACKET_TEXT = r'[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*'
+
+# Text inside (...) allowing one level of nested parentheses, e.g. "/wiki/Foo_(bar)"
+PAREN_TEXT = r'[^()]*(?:\([^()]*\)[^()]*)*'
+
+# The URL may not be empty
+IMAGE_PATTERN = re.compile(r'!\[(' + BRACKET_TEXT + r')\]\(((?!\))' + PAREN_TEXT + r')\)')
+LINK_PATTERN = re.compile(r'\[(' + BRACKET_TEXT + r')\]\(((?!\))' + PAREN_TEXT + r')\)')
+
+
+def iter_markdown_images(text):
+    """
+    Finds markdown images in the given text.
+
+    Args:
+        text (str): The raw markdown text.
+
+    Returns:
+        iterator: re.Match objects; group(1) is the alt text, group(2) the URL.
+    """
+    return IMAGE_PATTERN.finditer(text)
+
+
+def iter_markdown_links(text):
+    """
+    Finds markdown links in the given text.
+
+    Args:
+        text (str): The raw markdown text.
+
+    Returns:
+        iterator: re.Match objects; group(1) is the anchor text, group(2) the URL.
+    """
+    return LINK_PATTERN.finditer(text)
+
+
 def extract_markdown_images(text):
     """
     Extracts markdown images from the given text.
@@ -11,14 +62,7 @@ def extract_markdown_images(text):
     Returns:
         list: A list of tuples, each containing the alt text and URL of an image.
     """
-    # Updated regular expression to handle nested brackets
-    pattern = r'!\[([^\]]*(?:\[[^\]]*\][^\]]*)*)\]\(([^)]+)\)'
-    
-    # Find all matches in the text
-    matches = re.findall(pattern, text)
-    
-    # Return a list of tuples (alt_text, url)
-    return [(alt_text.strip(), url.strip()) for alt_text, url in matches]
+    return [(match.group(1).strip(), match.group(2).strip()) for match in iter_markdown_images(text)]
 
 
 def extract_markdown_links(text):
@@ -31,11 +75,4 @@ def extract_markdown_links(text):
     Returns:
         list: A list of tuples, each containing the anchor text and URL of a link.
     """
-    # Updated regular expression to handle nested brackets
-    pattern = r'\[([^\]]*(?:\[[^\]]*\][^\]]*)*)\]\(([^)]+)\)'
-    
-    # Find all matches in the text
-    matches = re.findall(pattern, text)
-    
-    # Return a list of tuples (anchor_text, url)
-    return [(anchor_text.strip(), url.strip()) for anchor_text, url in matches]
+    return [(match.group(1).strip(), match.group(2).strip()) for match in iter_markdown_links(text)]
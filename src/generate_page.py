@@ -1,34 +1,104 @@
+import io
 import os
 from markdown_to_html_node import markdown_to_html_node
-from extract_title import extract_title
+from chunked_render import markdown_to_html_node_chunked, DEFAULT_CHUNK_SIZE
+from page_info import PageInfo
+from template import Template, load_template
 
 
-def generate_page(from_path, template_path, dest_path, basepath="/"):
-    # Read the markdown file
-    with open(from_path, 'r', encoding='utf-8') as markdown_file:
-        markdown_content = markdown_file.read()
-
-    # Read the template file
-    with open(template_path, 'r', encoding='utf-8') as template_file:
-        template_content = template_file.read()
+def write_if_changed(dest_path, content):
+    """
+    Writes `content` to `dest_path` unless the file already holds exactly that.
 
-    # Convert markdown to HTML
-    html_node = markdown_to_html_node(markdown_content)
-    html_content = html_node.to_html()
+    Unchanged files keep their mtime, so downstream sync/upload steps don't
+    re-transfer them. The existing file is only read when its size matches.
 
-    # Extract the title
-    title = extract_title(markdown_content)
+    Args:
+        dest_path (str): The file to write.
+        content (str): The full file contents.
 
-    # Replace placeholders in the template
-    full_html = template_content.replace("{{ Title }}", title).replace("{{ Content }}", html_content)
-
-    # Replace href and src paths with basepath
-    full_html = full_html.replace('href="/', 'href="'+basepath)
-    full_html = full_html.replace('src="/', 'src="'+basepath)
+    Returns:
+        bool: True if the file was written, False if it was already identical.
+    """
+    data = content.encode('utf-8')
+    try:
+        if os.path.getsize(dest_path) == len(data):
+            with open(dest_path, 'rb') as existing_file:
+                if existing_file.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
 
     # Ensure the destination directory exists
     os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    with open(dest_path, 'wb') as dest_file:
+        dest_file.write(data)
+    return True
+
+
+def generate_page(from_path, template_path, dest_path, basepath="/", context=None, block_cache=None,
+                  chunk_executor=None, chunk_size=DEFAULT_CHUNK_SIZE, chunk_workers=1, page_info=None):
+    """
+    Renders one markdown file into an HTML page.
+
+    Args:
+        from_path (str): The markdown source.
+        template_path (str | Template): Path to the template, or a Template
+            already compiled for `basepath` and shared across pages.
+        dest_path (str): Where to write the HTML page.
+        basepath (str): The site root that absolute links are rewritten to.
+        context (dict): Extra template slot values, e.g. {"Description": "..."}.
+            A {{ TOC }} slot in the template is filled with a table of contents
+            built from the page's headings, and {{ WordCount }} and
+            {{ ReadingMinutes }} from its metadata. Builds through
+            generate_pages_recursive pass no context, so other extra slots are
+            only filled when generate_page is called directly.
+        block_cache (BlockCache): Optional cache of rendered blocks shared across pages.
+        chunk_executor (concurrent.futures.Executor): If given, the markdown is rendered
+            in chunks of about `chunk_size` characters in this executor; for very large pages.
+        chunk_size (int): Roughly how many characters of markdown go into one chunk.
+        chunk_workers (int): How many workers `chunk_executor` runs.
+        page_info (PageInfo): If given, filled with the page's metadata; the title
+            comes from the same parse.
+
+    Returns:
+        bool: True if the page was written, False if the existing file was identical.
+
+    Raises:
+        ValueError: If the markdown has no H1 heading to take the title from.
+    """
+    # Compile the template unless the caller already did
+    template = template_path if isinstance(template_path, Template) else load_template(template_path, basepath)
+
+    # Convert markdown to HTML, collecting the title and other metadata in the same pass.
+    # The file is scanned block by block, so the markdown is never held whole in memory.
+    if page_info is None:
+        page_info = PageInfo()
+    with open(from_path, 'r', encoding='utf-8') as markdown_file:
+        if chunk_executor is not None:
+            html_node = markdown_to_html_node_chunked(markdown_file, chunk_executor, basepath, chunk_size,
+                                                      chunk_workers, page_info=page_info)
+        else:
+            html_node = markdown_to_html_node(markdown_file, basepath, block_cache, page_info=page_info)
+
+    title = page_info.title
+    if title is None:
+        raise ValueError("No H1 header found in the markdown.")
+
+    # Fill the template slots
+    slots = dict(context) if context else {}
+    # Escaped by the template, like every string slot value
+    slots["Title"] = title
+    slots["Content"] = html_node
+    if "TOC" in template.slots and "TOC" not in slots:
+        # Built from the headings collected during the parse, not from the HTML
+        slots["TOC"] = page_info.table_of_contents()
+    slots.setdefault("WordCount", page_info.word_count)
+    slots.setdefault("ReadingMinutes", page_info.reading_minutes)
+
+    # Serialize the page once, straight into a single buffer
+    buffer = io.StringIO()
+    template.render_to(buffer, slots)
 
     # Write the full HTML to the destination file
-    with open(dest_path, 'w', encoding='utf-8') as dest_file:
-        dest_file.write(full_html)
\ No newline at end of file
+    return write_if_changed(dest_path, buffer.getvalue())
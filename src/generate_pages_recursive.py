@@ -1,9 +1,91 @@
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from generate_page import generate_page
+from chunked_render import DEFAULT_CHUNK_SIZE
+from build_manifest import BuildManifest, hash_file, page_inputs
+from template import load_template
+from page_info import PageInfo
+from logging_config import configure_logging
 
+# The compiled template and block cache, set once per worker process by _init_worker
+_worker_template = None
+_worker_block_cache = None
 
-def generate_pages_recursive(dir_path_content, template_path, dest_dir_path, basepath="/"):
-    # Walk through the content directory
+
+def _init_worker(template, log_level, block_cache=None):
+    global _worker_template, _worker_block_cache
+    _worker_template = template
+    _worker_block_cache = block_cache
+    if block_cache is not None:
+        # Forked workers share the parent's object without unpickling it
+        block_cache.track_delta()
+    # Workers don't run main.py, so carry the parent's logging level over
+    configure_logging(log_level)
+
+
+def _render_page(markdown_path, dest_path, basepath):
+    page_info = PageInfo()
+    written = generate_page(markdown_path, _worker_template, dest_path, basepath,
+                            block_cache=_worker_block_cache, page_info=page_info)
+    # Hand the blocks this page added back to the parent's cache
+    delta = _worker_block_cache.take_delta() if _worker_block_cache is not None else None
+    return written, delta, page_info
+
+
+class PageBuildError(Exception):
+    """
+    Raised once a build has finished if any page failed to render.
+
+    :param failures: A list of (markdown_path, exception) tuples, one per failed page
+    """
+
+    def __init__(self, failures):
+        self.failures = failures
+        details = "\n".join(
+            f"  {path}: {type(error).__name__}: {error}" for path, error in failures)
+        super().__init__(f"{len(failures)} page(s) failed to build:\n{details}")
+
+
+class BuildSummary:
+    """
+    Describes what a call to generate_pages_recursive did.
+
+    :param rendered: Output paths that were (re-)rendered
+    :param written: The rendered output paths whose file contents actually changed
+    :param up_to_date: Output paths skipped because none of their inputs changed
+    :param removed: Output paths deleted because their markdown source is gone
+    :param page_info: Mapping of each rendered output path to its PageInfo
+    """
+
+    def __init__(self, rendered: list = None, written: list = None, up_to_date: list = None,
+                 removed: list = None, page_info: dict = None):
+        self.rendered = rendered if rendered is not None else []
+        self.written = written if written is not None else []
+        self.up_to_date = up_to_date if up_to_date is not None else []
+        self.removed = removed if removed is not None else []
+        self.page_info = page_info if page_info is not None else {}
+
+    def __repr__(self):
+        return (f"BuildSummary(rendered={len(self.rendered)}, written={len(self.written)}, up_to_date={len(self.up_to_date)}, "
+                f"removed={len(self.removed)})")
+
+
+def plan_page_jobs(dir_path_content, dest_dir_path):
+    """
+    Collects every markdown -> HTML job under the content directory.
+
+    Jobs are ordered largest source file first so that the slowest pages are
+    started early instead of trailing at the end of a parallel build.
+
+    Args:
+        dir_path_content (str): The content directory to walk.
+        dest_dir_path (str): The output directory mirroring the content tree.
+
+    Returns:
+        list: A list of (markdown_path, dest_path) tuples.
+    """
+    jobs = []
     for root, _, files in os.walk(dir_path_content):
         for file in files:
             if file.endswith('.md'):
@@ -13,9 +95,132 @@ def generate_pages_recursive(dir_path_content, template_path, dest_dir_path, bas
                 html_filename = os.path.splitext(file)[0] + '.html'
                 dest_dir = os.path.join(dest_dir_path, relative_path)
                 dest_path = os.path.join(dest_dir, html_filename)
+                jobs.append((os.path.getsize(markdown_path), markdown_path, dest_path))
+
+    jobs.sort(key=lambda job: job[0], reverse=True)
+    return [(markdown_path, dest_path) for _, markdown_path, dest_path in jobs]
+
+
+def generate_pages_recursive(dir_path_content, template_path, dest_dir_path, basepath="/", jobs=1,
+                             manifest_path=None, force=False, block_cache=None, chunk_threshold=None,
+                             chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generates an HTML page for every markdown file under the content directory.
+
+    When `manifest_path` is given the build is incremental: only pages whose
+    source, template, basepath or generator version changed since the last
+    build are rendered, and outputs whose sources were deleted are removed.
+
+    Args:
+        dir_path_content (str): The content directory to walk.
+        template_path (str): Path to the HTML template.
+        dest_dir_path (str): The output directory.
+        basepath (str): The site root that absolute links are rewritten to.
+        jobs (int): Number of worker processes. 1 renders in-process, 0 uses one per CPU.
+        manifest_path (str): Where to keep the build manifest, or None to rebuild everything.
+        force (bool): Re-render every page even if the manifest says it is up to date.
+        block_cache (BlockCache): Optional cache of rendered blocks. Blocks rendered by
+            worker processes are merged back into it, so the caller can save it afterwards.
+        chunk_threshold (int): With more than one job, markdown files of at least this many
+            bytes are split into chunks of about `chunk_size` characters that the workers
+            render in parallel, before the other pages. None renders every page in a
+            single worker. Chunked pages don't use `block_cache`.
+        chunk_size (int): Roughly how many characters of markdown go into one chunk.
+
+    Returns:
+        BuildSummary: Which pages were rendered, skipped and removed.
+
+    Raises:
+        PageBuildError: If any page failed. Every other page is still generated.
+    """
+    page_jobs = plan_page_jobs(dir_path_content, dest_dir_path)
+    # Parse the template once and share it with every page and worker
+    template = load_template(template_path, basepath)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    summary = BuildSummary()
+    manifest = None
+    inputs = {}
+    pending = page_jobs
+    if manifest_path is not None:
+        manifest = BuildManifest.load(manifest_path, dir_path_content, dest_dir_path)
+        pending = []
+        for markdown_path, dest_path in page_jobs:
+            inputs[dest_path] = page_inputs(hash_file(markdown_path), template.source_hash, basepath)
+            if not force and manifest.is_up_to_date(dest_path, inputs[dest_path]):
+                summary.up_to_date.append(dest_path)
+            else:
+                pending.append((markdown_path, dest_path))
+        summary.removed = manifest.remove_stale(dest_path for _, dest_path in page_jobs)
+
+    def page_done(dest_path, written, page_info):
+        summary.rendered.append(dest_path)
+        if written:
+            summary.written.append(dest_path)
+        summary.page_info[dest_path] = page_info
+        if manifest is not None:
+            manifest.record(dest_path, inputs[dest_path], page_info.to_dict())
+
+    # Very large pages are split across the workers instead of occupying just one
+    large = []
+    if jobs > 1 and chunk_threshold is not None:
+        large = [job for job in pending if os.path.getsize(job[0]) >= chunk_threshold]
+        pending = [job for job in pending if job not in large]
+
+    failures = []
+    if not large and (jobs <= 1 or len(pending) <= 1):
+        for markdown_path, dest_path in pending:
+            page_info = PageInfo()
+            try:
+                written = generate_page(markdown_path, template, dest_path, basepath,
+                                        block_cache=block_cache, page_info=page_info)
+            except Exception as error:
+                failures.append((markdown_path, error))
+            else:
+                page_done(dest_path, written, page_info)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(template, logging.getLogger().level, block_cache)) as executor:
+            # Large pages go first, as plan_page_jobs intends: their chunks would otherwise
+            # queue behind every small page. Their chunk window keeps the workers busy.
+            # They skip the block cache, since worker caches only report back per page
+            # through _render_page, and a page this large is rarely made of blocks
+            # repeated on other pages.
+            for markdown_path, dest_path in large:
+                page_info = PageInfo()
+                try:
+                    written = generate_page(markdown_path, template, dest_path, basepath,
+                                            chunk_executor=executor, chunk_size=chunk_size, chunk_workers=jobs,
+                                            page_info=page_info)
+                except Exception as error:
+                    failures.append((markdown_path, error))
+                else:
+                    page_done(dest_path, written, page_info)
+            futures = {
+                executor.submit(_render_page, markdown_path, dest_path, basepath):
+                    (markdown_path, dest_path)
+                for markdown_path, dest_path in pending
+            }
+            for future in as_completed(futures):
+                markdown_path, dest_path = futures[future]
+                error = future.exception()
+                if error is not None:
+                    failures.append((markdown_path, error))
+                else:
+                    written, delta, page_info = future.result()
+                    if delta is not None:
+                        block_cache.merge(delta)
+                    page_done(dest_path, written, page_info)
 
-                # Generate the page using the existing generate_page function
-                generate_page(markdown_path, template_path,
-                              dest_path, basepath)
+    if manifest is not None:
+        # Failed pages are left out of the manifest so the next build retries them
+        manifest.save()
 
+    if failures:
+        # Report in plan order so repeated runs produce the same message
+        order = {markdown_path: i for i, (markdown_path, _) in enumerate(page_jobs)}
+        failures.sort(key=lambda failure: order[failure[0]])
+        raise PageBuildError(failures)
 
+    return summary
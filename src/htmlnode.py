@@ -1,6 +1,3 @@
-import logging
-
-
 """
 This module defines the HTMLNode class.
 
@@ -10,7 +7,65 @@ The HTMLNode class has 4 data members set in the constructor:
     value - A string representing the value of the HTML tag (e.g., the text inside a paragraph)
     children - A list of HTMLNode objects representing the children of this node
     props - A dictionary of key-value pairs representing the attributes of the HTML tag. For example, a link (<a> tag) might have {"href": "https://www.google.com"}
+
+Nodes use __slots__ instead of a per-instance __dict__, and nodes created
+without children or props share the immutable EMPTY_CHILDREN and EMPTY_PROPS
+sentinels instead of allocating an empty list and dict each.
+
+Leaf values are escaped with escape_text and prop values with escape_attr when
+serialized. HTMLRawNode carries markup that is already rendered and is written
+out unescaped.
 """
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def escape_text(text):
+    """
+    Escapes &, < and > for use as HTML element content.
+
+    Most text contains none of them, so it is returned as is without building
+    a new string.
+    """
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def escape_attr(value):
+    """
+    Escapes &, <, > and " for use inside a double-quoted HTML attribute.
+    """
+    if "&" not in value and "<" not in value and ">" not in value and '"' not in value:
+        return value
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+class _FrozenEmptyList(list):
+    """An empty list that refuses to be modified, shared by childless nodes."""
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("EMPTY_CHILDREN is shared and cannot be modified")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+
+class _FrozenEmptyDict(dict):
+    """An empty dict that refuses to be modified, shared by nodes without props."""
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("EMPTY_PROPS is shared and cannot be modified")
+
+    update = setdefault = pop = popitem = clear = _immutable
+    __setitem__ = __delitem__ = __ior__ = _immutable
+
+
+EMPTY_CHILDREN = _FrozenEmptyList()
+EMPTY_PROPS = _FrozenEmptyDict()
 
 
 class HTMLNode:
@@ -23,12 +78,17 @@ class HTMLNode:
     :param props: A dictionary of key-value pairs representing the attributes of the HTML tag
     """
 
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(self, tag: str = None, value: str = None, children: list = None, props: dict = None):
         self.tag = tag
         self.value = value
-        self.children = children if children is not None else []
-        self.props = props if props is not None else {}
+        self.children = children if children is not None else EMPTY_CHILDREN
+        self.props = props if props is not None else EMPTY_PROPS
+        self._check()
 
+    def _check(self):
+        """Checks this node's own fields; descendants are left to validate()."""
         # Ensure children is always a list
         if not isinstance(self.children, list):
             raise TypeError("children must be a list")
@@ -50,11 +110,74 @@ class HTMLNode:
             if not isinstance(key, str) or not isinstance(value, str):
                 raise TypeError("props keys and values must be strings")
 
+    def validate(self):
+        """
+        Checks every node in the tree rooted at this node.
+
+        The public constructors validate their arguments, but trees built by the
+        parser through the trusted() constructors skip those checks. Call this
+        when debugging to find the first malformed node in such a tree.
+
+        :raises TypeError: If a node has a field of the wrong type.
+        :raises ValueError: If a leaf has neither tag nor value, or a parent has no tag.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._check()
+            stack.extend(node.children)
+
     def to_html(self):
         raise NotImplementedError("to_hml method is not implemented yet")
 
+    def write_html(self, fp):
+        """
+        Writes the HTML for this node and its descendants to a text stream.
+
+        The tree is walked with an explicit stack rather than recursion, so
+        each tag and value is written exactly once, no per-level strings are
+        built, and deep nesting cannot hit the recursion limit.
+
+        :param fp: Any object with a write(str) method, e.g. an open file or io.StringIO
+        """
+        self._serialize(fp.write)
+
+    def _serialize(self, write):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.__class__ is str:
+                # A closing tag pushed below the node's children
+                write(node)
+            elif isinstance(node, HTMLParentNode):
+                node._check_renderable()
+                write(f"<{node.tag}{node.props_to_html()}>")
+                stack.append(f"</{node.tag}>")
+                stack.extend(reversed(node.children))
+            else:
+                write(node.to_html())
+
+    def text_content(self):
+        """
+        Returns the unescaped text of this node and its descendants, without markup.
+
+        Image alt text and raw (already rendered) HTML are not included.
+        """
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.tag == "img" or isinstance(node, HTMLRawNode):
+                continue
+            if node.value is not None:
+                parts.append(node.value)
+            stack.extend(reversed(node.children))
+        return "".join(parts)
+
     def props_to_html(self):
-        return "".join([f' {key}="{value}"' for key, value in self.props.items()])
+        if not self.props:
+            return ""
+        return "".join([f' {key}="{escape_attr(value)}"' for key, value in self.props.items()])
 
     def __repr__(self):
         return f"HTMLNode(tag={self.tag}, value={self.value}, children={self.children}, props={self.props})"
@@ -70,28 +193,74 @@ class HTMLLeafNode(HTMLNode):
     :param props: A dictionary of key-value pairs representing the attributes of the HTML tag
     """
 
+    __slots__ = ()
+
     def __init__(self, tag: str | None, value: str = None, props: dict = None):
-        logging.debug(
-            "Creating HTMLLeafNode with tag: %s, value: %s, props: %s", tag, value, props)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Creating HTMLLeafNode with tag: %s, value: %s, props: %s", tag, value, props)
         if tag is None and value is None:
-            logging.error(
+            logger.error(
                 "HTMLLeafNode is being created without a tag and without a value. Props: %s", props)
             raise ValueError("HTMLLeafNode must have a tag or a value.")
         super().__init__(tag=tag, value=value, props=props)
-        self.children = []
+        self.children = EMPTY_CHILDREN
+
+    @classmethod
+    def trusted(cls, tag: str | None, value: str = None, props: dict = None):
+        """
+        Creates a leaf node without validating its arguments.
+
+        For callers that only ever build well-formed nodes, such as the markdown
+        parser. Use validate() to check a tree built this way.
+        """
+        node = cls.__new__(cls)
+        node.tag = tag
+        node.value = value
+        node.children = EMPTY_CHILDREN
+        node.props = props if props is not None else EMPTY_PROPS
+        return node
+
+    def _check(self):
+        if self.tag is None and self.value is None:
+            raise ValueError("HTMLLeafNode must have a tag or a value.")
+        super()._check()
 
     def to_html(self):
         if self.tag is None:
             # Return plain text if no tag is provided
             if self.value is None:
                 raise ValueError("Leaf nodes with no tag must have a value.")
-            return self.value
+            return escape_text(self.value)
         if self.tag == "img":
             # Handle self-closing tags like <img>
             return f"<{self.tag}{self.props_to_html()} />"
         if self.value is None:
             raise ValueError("All leaf nodes must have a value.")
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+        return f"<{self.tag}{self.props_to_html()}>{escape_text(self.value)}</{self.tag}>"
+
+
+class HTMLRawNode(HTMLNode):
+    """
+    Initialize an HTMLRawNode instance.
+
+    Holds markup that has already been rendered, such as a cached fragment, and
+    is serialized verbatim without escaping. Never put untrusted text in one.
+    :param value: The HTML markup
+    """
+
+    __slots__ = ()
+
+    def __init__(self, value: str):
+        if not isinstance(value, str):
+            raise TypeError("HTMLRawNode value must be a string")
+        self.tag = None
+        self.value = value
+        self.children = EMPTY_CHILDREN
+        self.props = EMPTY_PROPS
+
+    def to_html(self):
+        return self.value
 
 
 class HTMLParentNode(HTMLNode):
@@ -105,41 +274,52 @@ class HTMLParentNode(HTMLNode):
     :param props: A dictionary of key-value pairs representing the attributes of the HTML tag
     """
 
+    __slots__ = ()
+
     def __init__(self, tag: str, children: list = None, props: dict = None):
         if children is None:
             children = []
         super().__init__(tag=tag, value=None, children=children, props=props)
-        self.value = None
-        # Ensure children is always a list
-        if not isinstance(self.children, list):
-            raise TypeError("children must be a list")
-        # Ensure props is always a dictionary
-        if not isinstance(self.props, dict):
-            raise TypeError("props must be a dictionary")
+
+    @classmethod
+    def trusted(cls, tag: str, children: list, props: dict = None):
+        """
+        Creates a parent node without validating its arguments.
+
+        For callers that only ever build well-formed nodes, such as the markdown
+        parser. Use validate() to check a tree built this way.
+        """
+        node = cls.__new__(cls)
+        node.tag = tag
+        node.value = None
+        node.children = children
+        node.props = props if props is not None else EMPTY_PROPS
+        return node
+
+    def _check(self):
+        super()._check()
         # Ensure tag is provided
         if self.tag is None:
             raise ValueError("tag must be provided")
-        # Ensure all children are HTMLNode instances
-        for child in self.children:
-            if not isinstance(child, HTMLNode):
-                raise TypeError("children must be HTMLNode instances")
 
     def to_html(self):
         """
         Generate an HTML string representation of the node and its children.
 
-        This method recursively calls `to_html` on each child node, concatenating their
-        HTML representations. The resulting HTML is wrapped between the opening and 
-        closing tags of the parent node.
+        The tree is serialized by write_html into a single list of fragments
+        that is joined once at the end.
 
-        :raises ValueError: If the node does not have a tag or if it has no children.
+        :raises ValueError: If the node or a descendant parent node has no tag or no children.
         :return: A string representing the HTML structure of the node and its children.
         """
+        parts = []
+        self._serialize(parts.append)
+        return "".join(parts)
+
+    def _check_renderable(self):
         if self.tag is None:
             raise ValueError("All parent nodes must have a tag.")
         if not self.children:
-            logging.error(
+            logger.error(
                 "Parent node with tag '%s' has no children. Node details: %s", self.tag, self)
             raise ValueError("All parent nodes must have children.")
-        children_html = ''.join(child.to_html() for child in self.children)
-        return f"<{self.tag}{self.props_to_html()}>{children_html}</{self.tag}>"
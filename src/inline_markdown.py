@@ -0,0 +1,90 @@
+"""
+This module turns inline markdown (the text inside a paragraph, list item,
+heading or quote) into HTML nodes with a single left-to-right scan.
+
+All inline syntaxes are combined into one compiled alternation, so the text is
+walked once no matter how many syntaxes there are, and formats that interleave
+come out in document order:
+
+    This is **bold**, _italic_, `code`, a [link](/x) and ![an image](/a.png)
+
+Nested inline elements are not supported, matching splitnodes.
+"""
+import re
+from htmlnode import HTMLLeafNode, HTMLParentNode
+from converter import LEAF_BUILDERS
+from textnode import TextType
+from basepath import apply_basepath
+from extractor import BRACKET_TEXT, PAREN_TEXT
+
+# Alternatives are tried left to right at each position, so images must come
+# before links (an image is a link with a leading "!"). Bracketed text and URLs
+# use the extractor's backtracking-safe fragments so unclosed "[" and "(" runs
+# stay linear.
+INLINE_PATTERN = re.compile(
+    r'!\[(?P<image_alt>' + BRACKET_TEXT + r')\]\((?P<image_url>' + PAREN_TEXT + r')\)'
+    r'|\[(?P<link_text>' + BRACKET_TEXT + r')\]\((?P<link_url>' + PAREN_TEXT + r')\)'
+    r'|`(?P<code>.*?)`'
+    r'|\*\*(?P<bold>.*?)\*\*'
+    r'|_(?P<italic>.*?)_'
+)
+
+DELIMITED_TYPES = {
+    "code": TextType.CODE,
+    "bold": TextType.BOLD,
+    "italic": TextType.ITALIC,
+}
+
+
+def iter_inline_tokens(text):
+    """
+    Scans inline markdown once, left to right.
+
+    Args:
+        text (str): The inline markdown.
+
+    Yields:
+        tuple: (text_type, text, url) for each run, in document order. url is
+        None except for LINK and IMAGE tokens; text is the alt text for images.
+    """
+    last_index = 0
+    for match in INLINE_PATTERN.finditer(text):
+        start = match.start()
+        if start > last_index:
+            yield TextType.TEXT, text[last_index:start], None
+        kind = match.lastgroup
+        if kind == "image_url":
+            yield TextType.IMAGE, match.group("image_alt"), match.group("image_url")
+        elif kind == "link_url":
+            yield TextType.LINK, match.group("link_text"), match.group("link_url")
+        else:
+            yield DELIMITED_TYPES[kind], match.group(kind), None
+        last_index = match.end()
+    if last_index < len(text):
+        yield TextType.TEXT, text[last_index:], None
+
+
+def inline_to_html_nodes(text, basepath="/"):
+    """
+    Converts inline markdown into a list of HTML nodes.
+
+    Args:
+        text (str): The inline markdown.
+        basepath (str): The site root that absolute link and image URLs are resolved against.
+
+    Returns:
+        list: Plain text leaves, b/i/code/img leaves and a parent nodes, in document order.
+    """
+    nodes = []
+    builders = LEAF_BUILDERS
+    for text_type, value, url in iter_inline_tokens(text):
+        if text_type == TextType.LINK:
+            # Links stay parent nodes so their text sits in a child leaf
+            nodes.append(HTMLParentNode.trusted(
+                tag="a",
+                children=[HTMLLeafNode.trusted(None, value)],
+                props={"href": apply_basepath(url, basepath)}))
+        else:
+            # Tokens go straight to the leaf builders, without a TextNode in between
+            nodes.append(builders[text_type](value, url, basepath))
+    return nodes
@@ -0,0 +1,22 @@
+"""
+This module configures logging for the site generator.
+
+Library modules only create loggers with logging.getLogger(__name__) and never
+configure logging on import; the entry point (main.py) calls configure_logging
+once with the level chosen on the command line. The default is WARNING, so a
+production build skips every debug payload.
+"""
+import logging
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def configure_logging(level="WARNING"):
+    """
+    Configures the root logger.
+
+    Args:
+        level (str | int): A level name from LOG_LEVELS or a logging level number.
+    """
+    logging.basicConfig(level=level, format=LOG_FORMAT, force=True)
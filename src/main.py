@@ -1,42 +1,98 @@
+import argparse
 import os
 import shutil
 import sys
-from generate_pages_recursive import generate_pages_recursive
+from generate_pages_recursive import generate_pages_recursive, PageBuildError
+from sync_static import sync_static
+from asset_publisher import COPY_MODES
+from block_cache import BlockCache, DEFAULT_MAXSIZE
+from chunked_render import DEFAULT_CHUNK_THRESHOLD
+from logging_config import configure_logging, LOG_LEVELS
 
 
-def copy_static_to_public(static_dir, public_dir):
-    # Delete the contents of the destination directory
-    if os.path.exists(public_dir):
-        shutil.rmtree(public_dir)
-    os.makedirs(public_dir, exist_ok=True)
-
-    # Recursively copy files and directories
-    for root, dirs, files in os.walk(static_dir):
-        for dir_name in dirs:
-            src_dir = os.path.join(root, dir_name)
-            dest_dir = os.path.join(
-                public_dir, os.path.relpath(src_dir, static_dir))
-            os.makedirs(dest_dir, exist_ok=True)
-        for file_name in files:
-            src_file = os.path.join(root, file_name)
-            dest_file = os.path.join(
-                public_dir, os.path.relpath(src_file, static_dir))
-            shutil.copy2(src_file, dest_file)
-
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the static site.")
+    # Basepath stays positional so `python3 src/main.py "/repo/"` keeps working
+    parser.add_argument("basepath", nargs="?", default="/",
+                        help="site root that absolute links are rewritten to (default: /)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of worker processes for rendering pages; 0 uses one per CPU (default: 1)")
+    parser.add_argument("--cache-dir", default=".cache",
+                        help="directory holding the incremental build manifest (default: .cache)")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the build manifest and re-render every page")
+    parser.add_argument("--clean", action="store_true",
+                        help="delete the output directory and rebuild it from scratch (implies --force)")
+    parser.add_argument("--checksum", action="store_true",
+                        help="compare static files by content hash instead of size and mtime")
+    parser.add_argument("--asset-mode", choices=COPY_MODES, default="copy",
+                        help="how static files are published; hardlink and reflink fall back to copy (default: copy)")
+    parser.add_argument("--asset-workers", type=int, default=None,
+                        help="number of threads publishing static files (default: chosen by Python)")
+    parser.add_argument("--chunk-threshold", type=int, default=DEFAULT_CHUNK_THRESHOLD,
+                        help="with --jobs, markdown files of at least this many bytes are rendered in parallel "
+                             f"chunks; 0 disables chunking (default: {DEFAULT_CHUNK_THRESHOLD})")
+    parser.add_argument("--block-cache-size", type=int, default=DEFAULT_MAXSIZE,
+                        help=f"number of rendered markdown blocks reused across pages; 0 disables the cache "
+                             f"(default: {DEFAULT_MAXSIZE})")
+    parser.add_argument("--persist-block-cache", action="store_true",
+                        help="keep the block cache in the cache directory between builds")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="WARNING", type=str.upper,
+                        help="logging verbosity; DEBUG traces every block and node (default: WARNING)")
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive integer")
+    if args.asset_workers is not None and args.asset_workers < 1:
+        parser.error("--asset-workers must be a positive integer")
+    if args.chunk_threshold < 0:
+        parser.error("--chunk-threshold must be 0 or a positive integer")
+    if args.block_cache_size < 0:
+        parser.error("--block-cache-size must be 0 or a positive integer")
+    return args
+
+
+def main(argv=None):
     static_dir = "static"
     public_dir = "docs"  # Changed from 'public' to 'docs' for GitHub Pages
     template_file = "template.html"
 
-    # Get basepath from CLI argument or default to '/'
-    basepath = sys.argv[1] if len(sys.argv) > 1 else "/"
+    args = parse_args(argv)
+    configure_logging(args.log_level)
 
     # Copy static files to docs directory
-    copy_static_to_public(static_dir, public_dir)
+    if args.clean and os.path.exists(public_dir):
+        shutil.rmtree(public_dir)
+    static_summary = sync_static(
+        static_dir, public_dir,
+        record_path=os.path.join(args.cache_dir, "static-manifest.json"),
+        checksum=args.checksum, mode=args.asset_mode, workers=args.asset_workers)
+    print(f"Static: {static_summary}")
 
     # Generate pages recursively with basepath
-    generate_pages_recursive(
-        "content", template_file, public_dir, basepath)
+    manifest_path = os.path.join(args.cache_dir, "build-manifest.json")
+    block_cache = None
+    block_cache_path = os.path.join(args.cache_dir, "block-cache.json")
+    if args.block_cache_size:
+        if args.persist_block_cache:
+            block_cache = BlockCache.load(block_cache_path, args.block_cache_size)
+        else:
+            block_cache = BlockCache(args.block_cache_size)
+    try:
+        summary = generate_pages_recursive(
+            "content", template_file, public_dir, args.basepath, jobs=args.jobs,
+            manifest_path=manifest_path, force=args.force or args.clean, block_cache=block_cache,
+            chunk_threshold=args.chunk_threshold or None)
+    except PageBuildError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if block_cache is not None and args.persist_block_cache:
+            block_cache.save(block_cache_path)
+    print(f"Pages: {len(summary.rendered)} rendered ({len(summary.written)} written), "
+          f"{len(summary.up_to_date)} up to date, "
+          f"{len(summary.removed)} removed")
+    if block_cache is not None:
+        print(f"Blocks: {block_cache.hits} cache hits, {block_cache.misses} misses, {len(block_cache)} cached")
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,60 @@
-import re
+import io
+
+
+def iter_markdown_blocks(source):
+    """
+    Scans Markdown line by line and yields its blocks as they are completed.
+
+    Blocks are separated by blank lines, and a line starting with '#' always
+    starts a new block. A code fence (a line starting with ```) starts a block
+    that runs to its closing fence, so blank lines and '#' lines inside code
+    stay part of it. Only the lines of the current block are held in memory.
+
+    Args:
+        source (str | file): The Markdown text, or a text file object to read it from.
+
+    Yields:
+        tuple: (line_number, block), where line_number is the 1-based line the block starts on.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+
+    lines = []
+    start = 0
+    # The backtick run that opened the current code fence, if inside one
+    fence = None
+    for number, line in enumerate(source, start=1):
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+        if fence is not None:
+            lines.append(line)
+            # A closing fence is only backticks, at least as many as the opening one
+            if stripped.startswith(fence) and not stripped.strip("`"):
+                yield start, "\n".join(lines).strip()
+                lines = []
+                fence = None
+            continue
+
+        if not stripped:
+            if lines:
+                yield start, "\n".join(lines).strip()
+                lines = []
+            continue
+
+        opens_fence = stripped.startswith("```") and "`" not in stripped.lstrip("`")
+        if lines and (line.startswith("#") or opens_fence):
+            yield start, "\n".join(lines).strip()
+            lines = []
+        if opens_fence:
+            fence = stripped[:len(stripped) - len(stripped.lstrip("`"))]
+        if not lines:
+            start = number
+        lines.append(line)
+
+    if lines:
+        # Also ends an unclosed code fence
+        yield start, "\n".join(lines).strip()
+
 
 def markdown_to_blocks(markdown):
     """
@@ -10,12 +66,4 @@ def markdown_to_blocks(markdown):
     Returns:
         list: A list of strings representing the blocks of the Markdown document.
     """
-    # Split the markdown text into blocks based on new lines and headings
-    blocks = []
-    for block in re.split(r'(\n\n|(?=^#))', markdown, flags=re.MULTILINE):
-        block = block.strip()
-        if block:
-            blocks.append(block)
-
-    return blocks
-
+    return [block for _, block in iter_markdown_blocks(markdown)]
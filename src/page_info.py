@@ -0,0 +1,153 @@
+"""
+This module defines PageInfo, the metadata gathered while a page is parsed.
+
+markdown_to_html_node fills a PageInfo block by block as it renders, so the
+title, heading outline, word count, links and images come out of the same
+parse as the HTML instead of another scan of the markdown. Each block is
+summarized from its rendered nodes by summarize_block; the summary is small
+and JSON-friendly, so the block cache stores it next to the block's HTML.
+"""
+import math
+from htmlnode import HTMLLeafNode, HTMLParentNode, HTMLRawNode
+
+WORDS_PER_MINUTE = 200
+
+HEADING_TAGS = {f"h{level}": level for level in range(1, 7)}
+
+
+def summarize_block(html_node):
+    """
+    Collects the metadata of one rendered block.
+
+    Args:
+        html_node (HTMLNode): The rendered block.
+
+    Returns:
+        list: [heading, word_count, links, images], where heading is [level, text, id]
+        or None, links is a list of hrefs and images a list of [alt, src].
+    """
+    heading = None
+    level = HEADING_TAGS.get(html_node.tag)
+    if level is not None:
+        text = html_node.text_content().partition("\n")[0].strip()
+        heading = [level, text, html_node.props.get("id")]
+
+    word_count = 0
+    links = []
+    images = []
+    stack = [html_node]
+    while stack:
+        node = stack.pop()
+        if node.tag == "img":
+            images.append([node.props.get("alt", ""), node.props.get("src", "")])
+            continue
+        if node.tag == "a":
+            links.append(node.props.get("href", ""))
+        if node.value is not None and not isinstance(node, HTMLRawNode):
+            word_count += len(node.value.split())
+        # Reversed so links and images are collected in document order
+        stack.extend(reversed(node.children))
+    return [heading, word_count, links, images]
+
+
+class PageInfo:
+    """
+    Initialize a PageInfo instance.
+
+    :param title: The text of the first level-1 heading, or None if there is none
+    :param headings: A (level, text, id) tuple for every heading, in document order
+    :param word_count: The number of words of text on the page, code included
+    :param links: The href of every link, in document order
+    :param images: An (alt, src) tuple for every image, in document order
+    """
+
+    def __init__(self, title: str = None, headings: list = None, word_count: int = 0, links: list = None,
+                 images: list = None):
+        self.title = title
+        self.headings = headings if headings is not None else []
+        self.word_count = word_count
+        self.links = links if links is not None else []
+        self.images = images if images is not None else []
+
+    @property
+    def reading_minutes(self):
+        """Estimated reading time, rounded up to whole minutes."""
+        return math.ceil(self.word_count / WORDS_PER_MINUTE)
+
+    def add_block(self, summary):
+        """Adds a block summary from summarize_block to the page."""
+        heading, word_count, links, images = summary
+        if heading is not None:
+            level, text, anchor = heading
+            self.headings.append((level, text, anchor))
+            if self.title is None and level == 1:
+                self.title = text
+        self.word_count += word_count
+        self.links.extend(links)
+        self.images.extend(tuple(image) for image in images)
+
+    def merge(self, other):
+        """Appends the metadata of `other`, a PageInfo for the text that follows this one."""
+        for level, text, _ in other.headings:
+            if self.title is None and level == 1:
+                self.title = text
+        self.headings.extend(other.headings)
+        self.word_count += other.word_count
+        self.links.extend(other.links)
+        self.images.extend(other.images)
+
+    def table_of_contents(self):
+        """
+        Builds a table of contents from the headings that have ids.
+
+        Deeper headings are nested in a list inside the entry of the heading
+        above them.
+
+        Returns:
+            HTMLParentNode: A <ul> of links to the headings, or None if there are none.
+        """
+        headings = [heading for heading in self.headings if heading[2] is not None]
+        if not headings:
+            return None
+        root = HTMLParentNode.trusted(tag="ul", children=[])
+        # [level, list, last entry] for each open list, outermost first
+        stack = [[min(level for level, _, _ in headings), root, None]]
+        for level, text, anchor in headings:
+            while len(stack) > 1 and level < stack[-1][0]:
+                stack.pop()
+            if level > stack[-1][0] and stack[-1][2] is not None:
+                nested = HTMLParentNode.trusted(tag="ul", children=[])
+                stack[-1][2].children.append(nested)
+                stack.append([level, nested, None])
+            link = HTMLParentNode.trusted(tag="a", children=[HTMLLeafNode.trusted(None, text)],
+                                          props={"href": f"#{anchor}"})
+            entry = HTMLParentNode.trusted(tag="li", children=[link])
+            stack[-1][1].children.append(entry)
+            stack[-1][2] = entry
+        return root
+
+    def to_dict(self):
+        """Returns the metadata as JSON-serializable data."""
+        return {
+            "title": self.title,
+            "headings": [list(heading) for heading in self.headings],
+            "word_count": self.word_count,
+            "reading_minutes": self.reading_minutes,
+            "links": list(self.links),
+            "images": [list(image) for image in self.images],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds a PageInfo from to_dict() output."""
+        return cls(data["title"], [tuple(heading) for heading in data["headings"]], data["word_count"],
+                   list(data["links"]), [tuple(image) for image in data["images"]])
+
+    def __eq__(self, other):
+        if not isinstance(other, PageInfo):
+            return False
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return (f"PageInfo(title={self.title!r}, headings={len(self.headings)}, word_count={self.word_count}, "
+                f"links={len(self.links)}, images={len(self.images)})")
@@ -0,0 +1,106 @@
+"""
+This module generates the anchor ids of headings.
+
+A heading's id is the slug of its text: lowercase words joined by hyphens, so
+"Reasons I like *Tolkien*!" becomes "reasons-i-like-tolkien". The same text
+always gives the same slug, so deep links stay stable between builds. Within a
+page, repeated slugs get a numeric suffix ("intro", "intro-1", ...) in
+document order.
+"""
+import re
+
+SLUG_DROP = re.compile(r'[^\w\s-]')
+SLUG_SEPARATORS = re.compile(r'[\s_-]+')
+
+# The id used for headings whose text has nothing to slug
+EMPTY_SLUG = "section"
+
+
+def slugify(text):
+    """
+    Returns the anchor slug for a heading's text.
+
+    Args:
+        text (str): The heading's plain text.
+
+    Returns:
+        str: Lowercase letters, digits and hyphens; never empty.
+    """
+    slug = SLUG_SEPARATORS.sub("-", SLUG_DROP.sub("", text.lower())).strip("-")
+    return slug or EMPTY_SLUG
+
+
+class SlugSet:
+    """
+    Tracks the ids already used on a page and hands out unique ones.
+    """
+
+    def __init__(self):
+        self.used = set()
+
+    def claim(self, slug):
+        """
+        Returns `slug`, or `slug` with the lowest free numeric suffix if it is taken.
+        """
+        unique = slug
+        suffix = 0
+        while unique in self.used:
+            suffix += 1
+            unique = f"{slug}-{suffix}"
+        self.used.add(unique)
+        return unique
+
+
+def reassign_heading_ids(html, headings, slugs):
+    """
+    De-duplicates the heading ids in already-rendered HTML.
+
+    Used where blocks are rendered without knowing the rest of the page, such
+    as cached blocks and chunks rendered in other processes. Only the opening
+    tags of the given headings are touched; the rest of the HTML is copied.
+
+    Args:
+        html (str): The rendered HTML.
+        headings (list): The (level, text, id) of each heading in `html`, in order.
+        slugs (SlugSet): The ids already used on the page.
+
+    Returns:
+        tuple: (html, headings) with every id made unique on the page.
+
+    Raises:
+        ValueError: If a heading's opening tag is not found as `<hN id="...">`, e.g.
+            because a custom handler put other attributes first. No id is claimed
+            then, so the caller can render the HTML again with `slugs` instead.
+    """
+    # Every tag is located before any id is claimed, so a failure leaves `slugs` as it was
+    found = []
+    position = 0
+    for level, text, anchor in headings:
+        if anchor is None:
+            found.append(None)
+            continue
+        # '<' is always escaped in text, so this only matches the heading's own tag
+        tag = f'<h{level} id="{anchor}"'
+        index = html.find(tag, position)
+        if index == -1:
+            raise ValueError(f"Heading tag {tag}> not found in the rendered HTML")
+        found.append(index)
+        position = index + len(tag)
+
+    parts = []
+    position = 0
+    result = []
+    for (level, text, anchor), index in zip(headings, found):
+        if anchor is None:
+            result.append((level, text, anchor))
+            continue
+        unique = slugs.claim(anchor)
+        if unique != anchor:
+            parts.append(html[position:index])
+            parts.append(f'<h{level} id="{unique}"')
+            position = index + len(f'<h{level} id="{anchor}"')
+        result.append((level, text, unique))
+    if not parts:
+        return html, result
+    parts.append(html[position:])
+    return "".join(parts), result
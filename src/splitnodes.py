@@ -21,9 +21,11 @@ Functions:
 """
 
 from textnode import TextType, TextNode
-from extractor import extract_markdown_images, extract_markdown_links
+from extractor import iter_markdown_images, iter_markdown_links
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 def split_nodes_delimiter(old_nodes, delimiter, text_type):
     """
@@ -38,6 +40,7 @@ def split_nodes_delimiter(old_nodes, delimiter, text_type):
         list: A new list of TextNode objects with the text split and types assigned.
     """
     new_nodes = []
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     for node in old_nodes:
         if isinstance(node, TextNode):
@@ -52,14 +55,38 @@ def split_nodes_delimiter(old_nodes, delimiter, text_type):
                         part,
                         text_type if i % 2 == 1 else node.text_type or TextType.TEXT
                     )
-                    logging.debug(
-                        f"Assigned TextType: {text_type if i % 2 == 1 else node.text_type or TextType.TEXT} to part: {part}")
+                    if debug:
+                        logger.debug("Assigned TextType: %s to part: %s", new_node.text_type, part)
                     new_nodes.append(new_node)
         else:
             new_nodes.append(node)  # Append non-TextNode objects as-is
 
     return new_nodes
 
+
+def _split_on_matches(node, matches, text_type):
+    """
+    Slices a node's text around extractor matches using their offsets.
+
+    Each match becomes a `text_type` node holding the stripped text followed by
+    a TEXT node holding the URL; the text between matches is kept as TEXT.
+    """
+    text = node.text
+    new_nodes = []
+    last_index = 0
+    for match in matches:
+        if match.start() > last_index:
+            new_nodes.append(TextNode(text[last_index:match.start()], TextType.TEXT))
+        new_nodes.append(TextNode(match.group(1).strip(), text_type))
+        new_nodes.append(TextNode(match.group(2).strip(), TextType.TEXT))
+        last_index = match.end()
+    if last_index == 0:
+        return [node]  # No matches; keep the original node
+    if last_index < len(text):
+        new_nodes.append(TextNode(text[last_index:], TextType.TEXT))
+    return new_nodes
+
+
 # Now that we have the extraction functions, we will need to be able to split raw markdown text into TextNodes based on images and links.
 # '''
 
@@ -81,20 +108,7 @@ def split_nodes_image(old_nodes):
                 new_nodes.append(node)
                 continue
 
-            matches = extract_markdown_images(node.text)
-            if matches:
-                remaining_text = node.text
-                for alt_text, url in matches:
-                    pre_text, remaining_text = remaining_text.split(
-                        f"![{alt_text}]({url})", 1)
-                    if pre_text:
-                        new_nodes.append(TextNode(pre_text, TextType.TEXT))
-                    new_nodes.append(TextNode(alt_text, TextType.IMAGE))
-                    new_nodes.append(TextNode(url, TextType.TEXT))
-                if remaining_text:
-                    new_nodes.append(TextNode(remaining_text, TextType.TEXT))
-            else:
-                new_nodes.append(node)
+            new_nodes.extend(_split_on_matches(node, iter_markdown_images(node.text), TextType.IMAGE))
         else:
             new_nodes.append(node)  # Append non-TextNode objects as-is
 
@@ -118,20 +132,7 @@ def split_nodes_link(old_nodes):
                 new_nodes.append(node)
                 continue
 
-            matches = extract_markdown_links(node.text)
-            if matches:
-                remaining_text = node.text
-                for anchor_text, url in matches:
-                    pre_text, remaining_text = remaining_text.split(
-                        f"[{anchor_text}]({url})", 1)
-                    if pre_text:
-                        new_nodes.append(TextNode(pre_text, TextType.TEXT))
-                    new_nodes.append(TextNode(anchor_text, TextType.LINK))
-                    new_nodes.append(TextNode(url, TextType.TEXT))
-                if remaining_text:
-                    new_nodes.append(TextNode(remaining_text, TextType.TEXT))
-            else:
-                new_nodes.append(node)
+            new_nodes.extend(_split_on_matches(node, iter_markdown_links(node.text), TextType.LINK))
         else:
             new_nodes.append(node)  # Append non-TextNode objects as-is
 
@@ -0,0 +1,159 @@
+"""
+This module publishes the static directory into the output directory incrementally.
+
+Instead of wiping the output and copying every asset again, each file under the
+static directory is compared against its published copy (size and mtime, or a
+content hash when asked) and only new or changed files are copied. Files that
+were published by an earlier sync but no longer exist under the static
+directory are deleted. Anything else in the output, such as generated pages, is
+left alone.
+
+Files that do need publishing are handed to a thread pool and published with
+asset_publisher.publish_file, which can hard-link or reflink instead of copying.
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from asset_publisher import publish_file
+from build_manifest import hash_file, prune_empty_dirs
+
+SYNC_RECORD_FORMAT = 1
+
+
+class SyncSummary:
+    """
+    Counts of what a call to sync_static did, in files and bytes.
+    """
+
+    def __init__(self):
+        self.copied_files = 0
+        self.copied_bytes = 0
+        self.skipped_files = 0
+        self.skipped_bytes = 0
+        self.deleted_files = 0
+        self.deleted_bytes = 0
+        # How many copied files went through each publish method
+        self.methods = {}
+
+    def __str__(self):
+        methods = ", ".join(f"{method}: {count}" for method, count in sorted(self.methods.items()))
+        return (f"{self.copied_files} copied ({self.copied_bytes} bytes"
+                f"{'; ' + methods if methods else ''}), "
+                f"{self.skipped_files} unchanged ({self.skipped_bytes} bytes), "
+                f"{self.deleted_files} deleted ({self.deleted_bytes} bytes)")
+
+
+def file_is_current(src_path, dest_path, checksum=False):
+    """
+    Checks whether `dest_path` already holds an up to date copy of `src_path`.
+
+    Args:
+        src_path (str): The static source file.
+        dest_path (str): Its published copy.
+        checksum (bool): Compare contents by hash instead of trusting mtime.
+
+    Returns:
+        bool: True if the file does not need copying.
+    """
+    try:
+        dest_stat = os.stat(dest_path)
+    except FileNotFoundError:
+        return False
+    src_stat = os.stat(src_path)
+    if os.path.samestat(src_stat, dest_stat):
+        return True  # Published as a hard link
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+    if checksum:
+        return hash_file(src_path) == hash_file(dest_path)
+    # copy2 preserves mtime; compare whole seconds to tolerate coarse filesystems
+    return int(src_stat.st_mtime) == int(dest_stat.st_mtime)
+
+
+def _load_record(record_path, static_dir, public_dir):
+    try:
+        with open(record_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    if (not isinstance(data, dict)
+            or data.get("format") != SYNC_RECORD_FORMAT
+            or data.get("static_dir") != static_dir
+            or data.get("public_dir") != public_dir):
+        return set()
+    return set(data.get("files", []))
+
+
+def _save_record(record_path, static_dir, public_dir, files):
+    directory = os.path.dirname(record_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = {
+        "format": SYNC_RECORD_FORMAT,
+        "static_dir": static_dir,
+        "public_dir": public_dir,
+        "files": sorted(files),
+    }
+    tmp_path = record_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp_path, record_path)
+
+
+def sync_static(static_dir, public_dir, record_path=None, checksum=False, mode="copy", workers=None):
+    """
+    Copies new and changed static files into the output directory and removes stale ones.
+
+    Args:
+        static_dir (str): The static asset directory.
+        public_dir (str): The output directory.
+        record_path (str): JSON file remembering which outputs came from the static
+            directory. Without it nothing is ever deleted.
+        checksum (bool): Compare file contents by hash instead of size and mtime.
+        mode (str): How files are published: "copy", "hardlink" or "reflink".
+        workers (int): Size of the publishing thread pool; None lets the executor decide.
+
+    Returns:
+        SyncSummary: Counts of copied, unchanged and deleted files.
+    """
+    static_dir = os.path.normpath(static_dir)
+    public_dir = os.path.normpath(public_dir)
+    summary = SyncSummary()
+    published = set()
+    to_publish = []
+
+    for root, _, files in os.walk(static_dir):
+        for file_name in files:
+            src_file = os.path.join(root, file_name)
+            relative_path = os.path.relpath(src_file, static_dir)
+            dest_file = os.path.join(public_dir, relative_path)
+            published.add(relative_path.replace(os.sep, '/'))
+            size = os.path.getsize(src_file)
+            if file_is_current(src_file, dest_file, checksum):
+                summary.skipped_files += 1
+                summary.skipped_bytes += size
+                continue
+            os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+            to_publish.append((src_file, dest_file, size))
+
+    if to_publish:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            methods = executor.map(
+                lambda task: publish_file(task[0], task[1], mode), to_publish)
+            for (_, _, size), method in zip(to_publish, methods):
+                summary.copied_files += 1
+                summary.copied_bytes += size
+                summary.methods[method] = summary.methods.get(method, 0) + 1
+
+    if record_path is not None:
+        previous = _load_record(record_path, static_dir, public_dir)
+        for relative_path in sorted(previous - published):
+            dest_file = os.path.join(public_dir, *relative_path.split('/'))
+            if os.path.isfile(dest_file):
+                summary.deleted_bytes += os.path.getsize(dest_file)
+                summary.deleted_files += 1
+                os.remove(dest_file)
+                prune_empty_dirs(os.path.dirname(dest_file), public_dir)
+        _save_record(record_path, static_dir, public_dir, published)
+
+    return summary
@@ -0,0 +1,117 @@
+"""
+This module defines a small template engine for the page template.
+
+A template is parsed once into alternating literal segments and named slots,
+for example:
+
+    <title>{{ Title }}</title><article>{{ Content }}</article>
+
+becomes the literals ["<title>", "</title><article>", "</article>"] and the
+slots ["Title", "Content"]. Rendering a page is then a single join over the
+segments with the slot values filled in, instead of a full-string replace per
+placeholder. Site-absolute href and src attributes in the literal segments are
+resolved against the basepath at compile time.
+
+generate_page fills Title, Content, TOC, WordCount and ReadingMinutes from the
+page. Slot values are escaped unless they are HTMLNodes (an HTMLRawNode holds
+trusted markup). Any other slot needs a value in its `context` argument, which site
+builds don't pass, so such slots render empty unless generate_page is called
+directly.
+"""
+import hashlib
+import re
+from basepath import apply_basepath_to_markup
+from htmlnode import HTMLNode, escape_attr
+
+SLOT_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+class Template:
+    """
+    Initialize a Template instance.
+
+    :param literals: The literal text around the slots; always one longer than slots
+    :param slots: The slot names, in document order
+    :param source_hash: SHA-256 hex digest of the template source
+    """
+
+    def __init__(self, literals: list, slots: list, source_hash: str = None):
+        if len(literals) != len(slots) + 1:
+            raise ValueError("A template needs exactly one more literal than slots.")
+        self.literals = literals
+        self.slots = slots
+        self.source_hash = source_hash
+
+    def render(self, context: dict) -> str:
+        """
+        Renders the template with the given slot values.
+
+        Slots missing from the context render as an empty string. Other values
+        are converted to strings and escaped with escape_attr, so they are safe
+        both as element text and inside a quoted attribute. An HTMLNode value is
+        serialized in place instead; pass trusted markup as an HTMLRawNode.
+
+        :param context: Mapping of slot name to value
+        :return: The rendered document
+        """
+        parts = []
+        self._render(parts.append, context)
+        return "".join(parts)
+
+    def render_to(self, fp, context: dict):
+        """
+        Renders the template with the given slot values straight into a text stream.
+
+        :param fp: Any object with a write(str) method, e.g. an open file or io.StringIO
+        :param context: Mapping of slot name to value
+        """
+        self._render(fp.write, context)
+
+    def _render(self, write, context):
+        write(self.literals[0])
+        for name, literal in zip(self.slots, self.literals[1:]):
+            value = context.get(name)
+            if value is not None:
+                if isinstance(value, HTMLNode):
+                    value._serialize(write)
+                else:
+                    write(escape_attr(str(value)))
+            write(literal)
+
+    def __eq__(self, other):
+        if not isinstance(other, Template):
+            return False
+        return self.literals == other.literals and self.slots == other.slots
+
+    def __repr__(self):
+        return f"Template(slots={self.slots})"
+
+
+def compile_template(text, basepath="/"):
+    """
+    Parses template text into a Template.
+
+    Args:
+        text (str): The template source, with slots written as {{ Name }}.
+        basepath (str): The site root that absolute href/src attributes are rewritten to.
+
+    Returns:
+        Template: The compiled template.
+    """
+    literals = []
+    slots = []
+    last_index = 0
+    for match in SLOT_PATTERN.finditer(text):
+        literals.append(apply_basepath_to_markup(text[last_index:match.start()], basepath))
+        slots.append(match.group(1))
+        last_index = match.end()
+    literals.append(apply_basepath_to_markup(text[last_index:], basepath))
+    return Template(literals, slots, hashlib.sha256(text.encode('utf-8')).hexdigest())
+
+
+def load_template(template_path, basepath="/"):
+    """
+    Reads and compiles the template at `template_path`.
+    """
+    with open(template_path, 'r', encoding='utf-8') as template_file:
+        return compile_template(template_file.read(), basepath)
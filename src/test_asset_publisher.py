@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from asset_publisher import publish_file
+
+
+class TestPublishFile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.tmp.name, "src.png")
+        self.dest = os.path.join(self.tmp.name, "dest.png")
+        with open(self.src, "wb") as f:
+            f.write(b"\x89PNG" * 1000)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_dest(self):
+        with open(self.dest, "rb") as f:
+            return f.read()
+
+    def test_copy(self):
+        self.assertEqual(publish_file(self.src, self.dest), "copy")
+        self.assertEqual(self.read_dest(), b"\x89PNG" * 1000)
+        self.assertFalse(os.path.samefile(self.src, self.dest))
+        self.assertEqual(int(os.stat(self.src).st_mtime), int(os.stat(self.dest).st_mtime))
+
+    def test_hardlink(self):
+        self.assertEqual(publish_file(self.src, self.dest, "hardlink"), "hardlink")
+        self.assertTrue(os.path.samefile(self.src, self.dest))
+
+    def test_hardlink_falls_back_to_copy(self):
+        with mock.patch("asset_publisher.os.link", side_effect=OSError(18, "Invalid cross-device link")):
+            self.assertEqual(publish_file(self.src, self.dest, "hardlink"), "copy")
+        self.assertEqual(self.read_dest(), b"\x89PNG" * 1000)
+
+    def test_reflink_or_fallback(self):
+        method = publish_file(self.src, self.dest, "reflink")
+        self.assertIn(method, ("reflink", "copy_file_range", "copy"))
+        self.assertEqual(self.read_dest(), b"\x89PNG" * 1000)
+        self.assertEqual(int(os.stat(self.src).st_mtime), int(os.stat(self.dest).st_mtime))
+
+    def test_replaces_hardlinked_dest_without_touching_source(self):
+        publish_file(self.src, self.dest, "hardlink")
+        other = os.path.join(self.tmp.name, "other.png")
+        with open(other, "wb") as f:
+            f.write(b"new")
+        publish_file(other, self.dest)
+        self.assertEqual(self.read_dest(), b"new")
+        with open(self.src, "rb") as f:
+            self.assertEqual(f.read(), b"\x89PNG" * 1000)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            publish_file(self.src, self.dest, "symlink")
+        self.assertEqual(os.listdir(self.tmp.name), ["src.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
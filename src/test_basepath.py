@@ -0,0 +1,27 @@
+import unittest
+from basepath import apply_basepath, apply_basepath_to_markup
+
+
+class TestBasepath(unittest.TestCase):
+
+    def test_site_absolute_url(self):
+        self.assertEqual(apply_basepath("/blog/tom", "/repo/"), "/repo/blog/tom")
+        self.assertEqual(apply_basepath("/", "/repo/"), "/repo/")
+
+    def test_default_basepath_is_noop(self):
+        self.assertEqual(apply_basepath("/blog/tom"), "/blog/tom")
+
+    def test_other_urls_unchanged(self):
+        for url in ("https://example.com/x", "images/a.png", "#top", "//cdn.example.com/a.js"):
+            with self.subTest(url=url):
+                self.assertEqual(apply_basepath(url, "/repo/"), url)
+
+    def test_markup(self):
+        markup = '<link href="/index.css" /><script src="//cdn.example.com/a.js"></script><a href="x">'
+        self.assertEqual(
+            apply_basepath_to_markup(markup, "/repo/"),
+            '<link href="/repo/index.css" /><script src="//cdn.example.com/a.js"></script><a href="x">')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+import block_cache
+from block_cache import BlockCache
+from htmlnode import HTMLRawNode
+from markdown_to_html_node import markdown_to_html_node
+
+
+class TestBlockCache(unittest.TestCase):
+
+    def test_key_depends_on_block_basepath_and_version(self):
+        key = BlockCache.key("Hello", "/")
+        self.assertEqual(key, BlockCache.key("Hello", "/"))
+        self.assertNotEqual(key, BlockCache.key("Hello!", "/"))
+        self.assertNotEqual(key, BlockCache.key("Hello", "/repo/"))
+        with mock.patch.object(block_cache, "GENERATOR_VERSION", "old"):
+            self.assertNotEqual(key, BlockCache.key("Hello", "/"))
+
+    def test_hits_misses_and_lru_eviction(self):
+        cache = BlockCache(maxsize=2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", "<p>a</p>")
+        cache.put("b", "<p>b</p>")
+        self.assertEqual(cache.get("a"), "<p>a</p>")
+        # "b" is now the least recently used
+        cache.put("c", "<p>c</p>")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "<p>c</p>")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (2, 2, 2))
+        with self.assertRaises(ValueError):
+            BlockCache(maxsize=0)
+
+    def test_delta_merge(self):
+        parent = BlockCache()
+        worker = pickle.loads(pickle.dumps(parent))
+        worker.get("a")
+        worker.put("a", "<p>a</p>")
+        worker.get("a")
+        parent.merge(worker.take_delta())
+        self.assertEqual((parent.hits, parent.misses, len(parent)), (1, 1, 1))
+        self.assertEqual(worker.take_delta(), ([], 0, 0))
+
+    def test_pickled_copy_keeps_entries_not_counters(self):
+        cache = BlockCache(maxsize=5)
+        cache.put("a", "<p>a</p>")
+        cache.get("a")
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual((copy.maxsize, len(copy), copy.hits), (5, 1, 0))
+        self.assertEqual(copy.take_delta(), ([], 0, 0))
+
+    def test_delta_is_only_tracked_in_worker_copies(self):
+        cache = BlockCache(maxsize=1)
+        cache.put("a", "<p>a</p>")
+        cache.put("b", "<p>b</p>")
+        self.assertEqual(cache.take_delta()[0], [])
+        cache.track_delta()
+        cache.put("c", "<p>c</p>")
+        self.assertEqual(cache.take_delta()[0], [("c", "<p>c</p>")])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache", "block-cache.json")
+            self.assertEqual(len(BlockCache.load(path)), 0)
+            cache = BlockCache()
+            for name in "abc":
+                cache.put(name, f"<p>{name}</p>")
+            cache.get("a")
+            cache.save(path)
+            # A smaller cache keeps the most recently used entries
+            loaded = BlockCache.load(path, maxsize=2)
+            self.assertEqual(len(loaded), 2)
+            self.assertEqual(loaded.get("a"), "<p>a</p>")
+            self.assertIsNone(loaded.get("b"))
+            with mock.patch.object(block_cache, "GENERATOR_VERSION", "other"):
+                self.assertEqual(len(BlockCache.load(path)), 0)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("not json")
+            self.assertEqual(len(BlockCache.load(path)), 0)
+
+    def test_markdown_to_html_node_with_cache(self):
+        markdown = "# Title\n\nA **repeated** [block](/x).\n\n```\n<code>\n```\n\nA **repeated** [block](/x)."
+        expected = markdown_to_html_node(markdown, "/repo/").to_html()
+        cache = BlockCache()
+        node = markdown_to_html_node(markdown, "/repo/", cache)
+        self.assertEqual(node.to_html(), expected)
+        self.assertTrue(all(isinstance(child, HTMLRawNode) for child in node.children))
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertEqual(markdown_to_html_node(markdown, "/repo/", cache).to_html(), expected)
+        self.assertEqual((cache.hits, cache.misses), (5, 3))
+        # Another basepath renders the links differently and must not reuse entries
+        self.assertEqual(markdown_to_html_node(markdown, "/", cache).to_html(),
+                         markdown_to_html_node(markdown, "/").to_html())
+
+
+if __name__ == "__main__":
+    unittest.main()
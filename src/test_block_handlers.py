@@ -0,0 +1,82 @@
+import unittest
+from block_cache import BlockCache
+from block_handlers import (BlockHandler, BlockHandlerRegistry, BLOCK_HANDLERS, ParagraphHandler,
+                            default_registry)
+from block_type import BlockType
+from htmlnode import HTMLParentNode, HTMLRawNode
+from inline_markdown import inline_to_html_nodes
+from markdown_to_html_node import markdown_to_html_node
+
+
+class NoteHandler(BlockHandler):
+    block_type = "note"
+
+    def detect(self, block):
+        return block.startswith("!!! note")
+
+    def render(self, info, basepath, debug):
+        return HTMLParentNode.trusted("aside", inline_to_html_nodes(info.block[len("!!! note"):].strip(), basepath))
+
+
+class TestBlockHandlers(unittest.TestCase):
+
+    def test_builtin_handlers(self):
+        self.assertEqual(
+            markdown_to_html_node("```\nx = 1\n```\n\n1. a\n2. b").to_html(),
+            "<div><pre><code>x = 1</code></pre><ol><li>a</li><li>b</li></ol></div>")
+        for block_type in BlockType:
+            self.assertEqual(BLOCK_HANDLERS.handler_for(
+                {BlockType.PARAGRAPH: "text", BlockType.HEADING: "# h", BlockType.CODE: "```\nc\n```",
+                 BlockType.QUOTE: "> q", BlockType.UNORDERED_LIST: "- u", BlockType.ORDERED_LIST: "1. o",
+                 BlockType.IMAGE: "![i](/i.png)"}[block_type]).block_type, block_type)
+
+    def test_custom_handler(self):
+        registry = default_registry()
+        registry.register(NoteHandler())
+        markdown = "!!! note Read **this**\n\nA paragraph."
+        self.assertEqual(markdown_to_html_node(markdown, handlers=registry).to_html(),
+                         "<div><aside>Read <b>this</b></aside><p>A paragraph.</p></div>")
+        # The default registry is untouched
+        self.assertEqual(markdown_to_html_node(markdown).to_html(),
+                         "<div><p>!!! note Read <b>this</b></p><p>A paragraph.</p></div>")
+
+    def test_replacing_a_handler(self):
+        class ShoutHandler(ParagraphHandler):
+            def render(self, info, basepath, debug):
+                return HTMLRawNode(f"<p>{info.block.upper()}</p>")
+
+        registry = default_registry()
+        fingerprint = registry.fingerprint
+        registry.register(ShoutHandler())
+        self.assertNotEqual(registry.fingerprint, fingerprint)
+        self.assertEqual(markdown_to_html_node("hi", handlers=registry).to_html(), "<div><p>HI</p></div>")
+
+        # Blocks cached under one registry are not served to another
+        cache = BlockCache()
+        markdown_to_html_node("hi", block_cache=cache)
+        self.assertEqual(markdown_to_html_node("hi", block_cache=cache, handlers=registry).to_html(),
+                         "<div><p>HI</p></div>")
+        self.assertEqual(cache.hits, 0)
+
+    def test_fallback_and_placeholder(self):
+        registry = BlockHandlerRegistry()
+        self.assertEqual(registry.render("plain <text>").to_html(), "<div>plain &lt;text&gt;</div>")
+        registry.register(ParagraphHandler())
+        # A paragraph with no inline content still gets a child
+        self.assertEqual(registry.render("").to_html(), "<p></p>")
+        with self.assertRaises(ValueError):
+            registry.register(BlockHandler())
+
+    def test_stats(self):
+        registry = default_registry()
+        markdown_to_html_node("# T\n\na\n\nb\n\n- c", handlers=registry)
+        stats = registry.stats()
+        self.assertEqual({block_type: entry["calls"] for block_type, entry in stats.items()},
+                         {BlockType.HEADING: 1, BlockType.PARAGRAPH: 2, BlockType.UNORDERED_LIST: 1})
+        self.assertTrue(all(entry["seconds"] >= 0 for entry in stats.values()))
+        registry.reset_stats()
+        self.assertEqual(registry.stats(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
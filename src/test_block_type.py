@@ -1,5 +1,26 @@
+import itertools
 import unittest
-from block_type import BlockType, block_to_block_type
+from block_type import BlockInfo, BlockType, block_to_block_type, classify_block
+
+
+def reference_block_type(block):
+    """The multi-pass classifier classify_block replaced, kept to check precedence."""
+    if not block.strip():
+        return BlockType.PARAGRAPH
+    lines = block.splitlines()
+    if lines[0].startswith(tuple(f"{'#' * i} " for i in range(1, 7))):
+        return BlockType.HEADING
+    if block.startswith("```") and block.endswith("```"):
+        return BlockType.CODE
+    if any(line.startswith(">") for line in lines):
+        return BlockType.QUOTE
+    if all(line.startswith("- ") for line in lines):
+        return BlockType.UNORDERED_LIST
+    if all(line.startswith(f"{i}. ") for i, line in enumerate(lines, start=1)):
+        return BlockType.ORDERED_LIST
+    if block.startswith("![") and block.endswith(")"):
+        return BlockType.IMAGE
+    return BlockType.PARAGRAPH
 
 class TestBlockType(unittest.TestCase):
 
@@ -50,5 +71,33 @@ class TestBlockType(unittest.TestCase):
         block = "-Item without space"
         self.assertEqual(block_to_block_type(block), BlockType.PARAGRAPH)
 
+class TestClassifyBlock(unittest.TestCase):
+
+    def test_heading_metadata(self):
+        self.assertEqual(classify_block("### Title *x*"),
+                         BlockInfo(BlockType.HEADING, "### Title *x*", level=3, text="Title *x*"))
+        self.assertEqual(classify_block("####### seven").block_type, BlockType.PARAGRAPH)
+
+    def test_code_metadata(self):
+        self.assertEqual(classify_block("```\nx = 1\n```"),
+                         BlockInfo(BlockType.CODE, "```\nx = 1\n```", text="x = 1"))
+        info = classify_block("```python\nx = 1\ny = 2\n```")
+        self.assertEqual((info.language, info.text), ("python", "x = 1\ny = 2"))
+
+    def test_list_and_quote_metadata(self):
+        self.assertEqual(classify_block("- a\n-  b ").items, ["a", "b"])
+        self.assertEqual(classify_block("1. a\n2. b\n3. c\n4. d\n5. e\n6. f\n7. g\n8. h\n9. i\n10. j").items,
+                         list("abcdefghij"))
+        self.assertEqual(classify_block("> one\nlazy\n> two").text, "one\ntwo")
+
+    def test_precedence_matches_reference(self):
+        lines = ["# h", "#x", "```", "```py", "> q", ">", "- u", "-u", "1. o", "2. o", "![a](/b)", "text", "", " "]
+        for count in (1, 2, 3):
+            for combination in itertools.product(lines, repeat=count):
+                block = "\n".join(combination)
+                with self.subTest(block=block):
+                    self.assertEqual(block_to_block_type(block), reference_block_type(block))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
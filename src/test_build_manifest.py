@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from build_manifest import BuildManifest, page_inputs, hash_file, GENERATOR_VERSION
+from page_info import PageInfo
+
+
+class TestBuildManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dest_dir = os.path.join(self.tmp.name, "docs")
+        self.manifest_path = os.path.join(self.tmp.name, ".cache", "manifest.json")
+        os.makedirs(os.path.join(self.dest_dir, "blog", "old"))
+        self.page = os.path.join(self.dest_dir, "index.html")
+        self.old_page = os.path.join(self.dest_dir, "blog", "old", "index.html")
+        for path in (self.page, self.old_page):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("<html></html>")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hash_file(self):
+        self.assertEqual(hash_file(self.page), hash_file(self.old_page))
+
+    def test_page_inputs_include_version(self):
+        self.assertEqual(page_inputs("a", "b", "/")["version"], GENERATOR_VERSION)
+
+    def test_round_trip(self):
+        manifest = BuildManifest.load(self.manifest_path, "content", self.dest_dir)
+        inputs = page_inputs("a", "b", "/")
+        self.assertFalse(manifest.is_up_to_date(self.page, inputs))
+        manifest.record(self.page, inputs)
+        manifest.save()
+
+        reloaded = BuildManifest.load(self.manifest_path, "content", self.dest_dir)
+        self.assertTrue(reloaded.is_up_to_date(self.page, inputs))
+        self.assertFalse(reloaded.is_up_to_date(self.page, page_inputs("a", "b", "/repo/")))
+
+    def test_missing_output_is_not_up_to_date(self):
+        manifest = BuildManifest(self.manifest_path, "content", self.dest_dir)
+        inputs = page_inputs("a", "b", "/")
+        manifest.record(self.page, inputs)
+        os.remove(self.page)
+        self.assertFalse(manifest.is_up_to_date(self.page, inputs))
+
+    def test_other_directories_ignore_manifest(self):
+        manifest = BuildManifest(self.manifest_path, "content", self.dest_dir)
+        manifest.record(self.page, page_inputs("a", "b", "/"))
+        manifest.save()
+        other = BuildManifest.load(self.manifest_path, "content", os.path.join(self.tmp.name, "public"))
+        self.assertEqual(other.pages, {})
+
+    def test_corrupt_manifest_is_ignored(self):
+        os.makedirs(os.path.dirname(self.manifest_path))
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        self.assertEqual(BuildManifest.load(self.manifest_path, "content", self.dest_dir).pages, {})
+
+    def test_remove_stale(self):
+        manifest = BuildManifest(self.manifest_path, "content", self.dest_dir)
+        manifest.record(self.page, page_inputs("a", "b", "/"))
+        manifest.record(self.old_page, page_inputs("c", "b", "/"))
+        removed = manifest.remove_stale([self.page])
+        self.assertEqual(removed, [self.old_page])
+        self.assertTrue(os.path.exists(self.page))
+        self.assertFalse(os.path.exists(os.path.join(self.dest_dir, "blog")))
+        self.assertEqual(list(manifest.pages), ["index.html"])
+
+    def test_page_metadata(self):
+        info = PageInfo("Home", [(1, "Home", "home")], 3, ["/blog"], [("Alt", "/a.png")])
+        manifest = BuildManifest(self.manifest_path, "content", self.dest_dir)
+        manifest.record(self.page, page_inputs("a", "b", "/"), info.to_dict())
+        manifest.record(self.old_page, page_inputs("c", "b", "/"), PageInfo("Old").to_dict())
+        manifest.save()
+        loaded = BuildManifest.load(self.manifest_path, "content", self.dest_dir)
+        self.assertEqual(loaded.page_info(self.page), info)
+        # The table of contents can be rebuilt from the stored headings alone
+        self.assertEqual(loaded.page_info(self.page).table_of_contents().to_html(),
+                         '<ul><li><a href="#home">Home</a></li></ul>')
+        loaded.remove_stale([self.page])
+        self.assertIsNone(loaded.page_info(self.old_page))
+        self.assertEqual(list(loaded.metadata), ["index.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
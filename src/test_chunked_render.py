@@ -0,0 +1,74 @@
+import unittest
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+from block_handlers import BLOCK_HANDLERS
+from chunked_render import iter_block_chunks, markdown_to_html_node_chunked
+from markdown_to_html_node import markdown_to_html_node, MarkdownRenderError
+
+DOCUMENT = "\n\n".join([
+    "# Title",
+    "A paragraph with **bold** and a [link](/page).",
+    "```\ncode\n\n# not a heading\n```",
+    "- one\n- two",
+    "> quoted <text>",
+    "1. first\n2. second",
+    "![image](/img.png)",
+] * 20)
+
+
+class TestChunkedRender(unittest.TestCase):
+
+    def test_chunks_hold_whole_blocks_in_order(self):
+        chunks = list(iter_block_chunks(DOCUMENT, chunk_size=100))
+        self.assertGreater(len(chunks), 1)
+        blocks = [block for chunk in chunks for _, block in chunk]
+        self.assertEqual(blocks.count("```\ncode\n\n# not a heading\n```"), 20)
+        self.assertEqual(len(blocks), 140)
+        line_numbers = [line_number for chunk in chunks for line_number, _ in chunk]
+        self.assertEqual(line_numbers, sorted(line_numbers))
+
+    def test_matches_single_pass_rendering(self):
+        expected = markdown_to_html_node(DOCUMENT, "/repo/").to_html()
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            node = markdown_to_html_node_chunked(DOCUMENT, executor, "/repo/", chunk_size=200)
+        self.assertGreater(len(node.children), 1)
+        self.assertEqual(node.to_html(), expected)
+
+    def test_small_window(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            node = markdown_to_html_node_chunked(DOCUMENT, executor, chunk_size=50, max_pending=1)
+        self.assertEqual(node.to_html(), markdown_to_html_node(DOCUMENT).to_html())
+
+    def test_window_follows_the_worker_count(self):
+        counts = {"submitted": 0, "collected": 0, "most_pending": 0}
+
+        class CountedFuture(Future):
+            def result(self, timeout=None):
+                counts["collected"] += 1
+                return super().result(timeout)
+
+        class InlineExecutor:
+            # Runs each chunk at once and records how many were left uncollected
+            def submit(self, fn, *args):
+                future = CountedFuture()
+                future.set_result(fn(*args))
+                counts["submitted"] += 1
+                counts["most_pending"] = max(counts["most_pending"], counts["submitted"] - counts["collected"])
+                return future
+
+        node = markdown_to_html_node_chunked(DOCUMENT, InlineExecutor(), chunk_size=20, workers=3)
+        self.assertEqual(node.to_html(), markdown_to_html_node(DOCUMENT).to_html())
+        self.assertGreater(counts["submitted"], 6)
+        self.assertEqual(counts["most_pending"], 6)
+
+    def test_errors_keep_the_line_number(self):
+        quote = BLOCK_HANDLERS.handler_for("> q")
+        with mock.patch.object(quote, "render", side_effect=ValueError("bad quote")):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                with self.assertRaises(MarkdownRenderError) as context:
+                    markdown_to_html_node_chunked(DOCUMENT, executor, chunk_size=100)
+        self.assertEqual(context.exception.line_number, 14)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 from parameterized import parameterized
 from textnode import TextNode, TextType
-from converter import text_node_to_html_node
+from converter import text_node_to_html_node, text_nodes_to_html_nodes
+from text_to_textnode import text_to_textnode
 
 class TestConverter(unittest.TestCase):
 
@@ -38,5 +39,28 @@ class TestConverter(unittest.TestCase):
         self.assertEqual(html_node.tag, None)
         self.assertEqual(html_node.value, "")
 
+    def test_text_node_to_html_node_basepath(self):
+        link = text_node_to_html_node(TextNode("Home", TextType.LINK, "/blog"), basepath="/repo/")
+        image = text_node_to_html_node(TextNode("Alt", TextType.IMAGE, "/images/a.png"), basepath="/repo/")
+        self.assertEqual(link.props, {"href": "/repo/blog"})
+        self.assertEqual(image.props["src"], "/repo/images/a.png")
+
+    def test_text_nodes_to_html_nodes(self):
+        text_nodes = text_to_textnode("Plain **bold** _it_ `code` [link](/a) ![img](/b.png) end")
+        batch = text_nodes_to_html_nodes(text_nodes, basepath="/repo/")
+        single = [text_node_to_html_node(node, basepath="/repo/") for node in text_nodes]
+        self.assertEqual([node.to_html() for node in batch], [node.to_html() for node in single])
+        self.assertIn('<a href="/repo/a">link</a>', [node.to_html() for node in batch])
+        self.assertEqual(text_nodes_to_html_nodes([]), [])
+
+    def test_text_nodes_to_html_nodes_invalid_type(self):
+        text_node = TextNode("Fine", TextType.TEXT)
+        # Bypass TextNode's own check to reach the converter's
+        bad_node = TextNode("Bad", TextType.TEXT)
+        bad_node.text_type = "INVALID_TYPE"
+        with self.assertRaises(ValueError) as context:
+            text_nodes_to_html_nodes([text_node, bad_node])
+        self.assertIn("Invalid TextType: INVALID_TYPE", str(context.exception))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import unittest
-from extractor import extract_markdown_images, extract_markdown_links
+from extractor import (extract_markdown_images, extract_markdown_links,
+                       iter_markdown_images, iter_markdown_links)
 
 class TestExtractor(unittest.TestCase):
 
@@ -74,5 +75,33 @@ class TestExtractor(unittest.TestCase):
         expected = [("anchor [nested]", "https://example.com")]
         self.assertEqual(extract_markdown_links(text), expected)
 
+    def test_iter_markdown_images_offsets(self):
+        text = "a ![one](u1) b ![two](u2)"
+        matches = list(iter_markdown_images(text))
+        self.assertEqual([m.group(1, 2) for m in matches], [("one", "u1"), ("two", "u2")])
+        self.assertEqual([text[m.start():m.end()] for m in matches], ["![one](u1)", "![two](u2)"])
+
+    def test_iter_markdown_links_offsets(self):
+        text = "[a [b]](u) and [c](d)"
+        matches = list(iter_markdown_links(text))
+        self.assertEqual([(m.start(), m.end()) for m in matches], [(0, 10), (15, 21)])
+
+    def test_pathological_input(self):
+        # Each of these used to take seconds with the nested-bracket pattern
+        for text in ("[" * 5000, "![" * 5000, "[a](" * 5000, "[" + "[a]" * 5000):
+            with self.subTest(text=text[:8]):
+                self.assertEqual(extract_markdown_links(text), [])
+                self.assertEqual(extract_markdown_images(text), [])
+        # Unclosed parentheses in a URL
+        for text in ("[a](" + "(" * 5000, "[a](" + "()" * 5000 + "("):
+            with self.subTest(text=text[:8]):
+                self.assertEqual(extract_markdown_links(text), [])
+
+    def test_urls_with_parentheses(self):
+        self.assertEqual(extract_markdown_links("[Foo](https://en.wikipedia.org/wiki/Foo_(bar)) but not [x]()"),
+                         [("Foo", "https://en.wikipedia.org/wiki/Foo_(bar)")])
+        self.assertEqual(extract_markdown_images("![cat](/c_(1).png)."), [("cat", "/c_(1).png")])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
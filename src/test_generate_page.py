@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from generate_page import generate_page, write_if_changed
+from markdown_to_html_node import markdown_to_html_node
+from template import compile_template
+from page_info import PageInfo
+
+
+class TestGeneratePage(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.markdown_path = os.path.join(self.tmp.name, "index.md")
+        self.dest_path = os.path.join(self.tmp.name, "docs", "index.html")
+        with open(self.markdown_path, "w", encoding="utf-8") as f:
+            f.write("# Home\n\n[Blog](/blog)")
+        self.template = compile_template(
+            '<title>{{ Title }}</title><link href="/index.css">{{ Content }}', "/repo/")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_dest(self):
+        with open(self.dest_path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_generate_page(self):
+        self.assertTrue(generate_page(self.markdown_path, self.template, self.dest_path, "/repo/"))
+        self.assertEqual(
+            self.read_dest(),
+            '<title>Home</title><link href="/repo/index.css">'
+            '<div><h1 id="home">Home</h1><p><a href="/repo/blog">Blog</a></p></div>')
+
+    def test_markdown_is_streamed_from_the_file(self):
+        with mock.patch("generate_page.markdown_to_html_node", wraps=markdown_to_html_node) as render:
+            generate_page(self.markdown_path, self.template, self.dest_path, "/repo/")
+        # The renderer scans the open file block by block instead of a string of the whole page
+        self.assertNotIsInstance(render.call_args.args[0], str)
+        self.assertIn('<h1 id="home">Home</h1>', self.read_dest())
+
+    def test_title_and_content_are_escaped(self):
+        with open(self.markdown_path, "w", encoding="utf-8") as f:
+            f.write("# Tom & Jerry\n\n[< Back](/)")
+        generate_page(self.markdown_path, self.template, self.dest_path, "/repo/")
+        self.assertEqual(
+            self.read_dest(),
+            '<title>Tom &amp; Jerry</title><link href="/repo/index.css">'
+            '<div><h1 id="tom-jerry">Tom &amp; Jerry</h1><p><a href="/repo/">&lt; Back</a></p></div>')
+
+    def test_table_of_contents_slot(self):
+        with open(self.markdown_path, "w", encoding="utf-8") as f:
+            f.write("# Home\n\n## Setup\n\ntext\n\n## Setup")
+        template = compile_template("<nav>{{ TOC }}</nav>{{ Content }}")
+        generate_page(self.markdown_path, template, self.dest_path)
+        self.assertEqual(
+            self.read_dest(),
+            '<nav><ul><li><a href="#home">Home</a><ul><li><a href="#setup">Setup</a></li>'
+            '<li><a href="#setup-1">Setup</a></li></ul></li></ul></nav>'
+            '<div><h1 id="home">Home</h1><h2 id="setup">Setup</h2><p>text</p><h2 id="setup-1">Setup</h2></div>')
+
+    def test_title_is_escaped_for_attributes(self):
+        with open(self.markdown_path, "w", encoding="utf-8") as f:
+            f.write('# The "Quoted" <Title>')
+        generate_page(self.markdown_path, compile_template('<meta content="{{ Title }}">'), self.dest_path)
+        self.assertEqual(self.read_dest(), '<meta content="The &quot;Quoted&quot; &lt;Title&gt;">')
+
+    def test_metadata_and_context_slots(self):
+        template = compile_template("{{ WordCount }} {{ ReadingMinutes }} [{{ Description }}]")
+        generate_page(self.markdown_path, template, self.dest_path)
+        self.assertEqual(self.read_dest(), "2 1 []")
+        generate_page(self.markdown_path, template, self.dest_path, context={"Description": "Hi", "WordCount": 9})
+        self.assertEqual(self.read_dest(), "9 1 [Hi]")
+
+    def test_page_info_and_missing_title(self):
+        page_info = PageInfo()
+        generate_page(self.markdown_path, self.template, self.dest_path, "/repo/", page_info=page_info)
+        self.assertEqual((page_info.title, page_info.links, page_info.word_count), ("Home", ["/repo/blog"], 2))
+        with open(self.markdown_path, "w", encoding="utf-8") as f:
+            f.write("## Not a title\n\n```\n# a comment\n```")
+        with self.assertRaises(ValueError):
+            generate_page(self.markdown_path, self.template, self.dest_path, "/repo/")
+
+    def test_unchanged_page_is_not_rewritten(self):
+        generate_page(self.markdown_path, self.template, self.dest_path, "/repo/")
+        os.utime(self.dest_path, (0, 0))
+        self.assertFalse(generate_page(self.markdown_path, self.template, self.dest_path, "/repo/"))
+        self.assertEqual(os.stat(self.dest_path).st_mtime, 0)
+
+    def test_write_if_changed(self):
+        self.assertTrue(write_if_changed(self.dest_path, "abc"))
+        self.assertFalse(write_if_changed(self.dest_path, "abc"))
+        # Same size, different bytes
+        self.assertTrue(write_if_changed(self.dest_path, "abd"))
+        self.assertEqual(self.read_dest(), "abd")
+
+
+if __name__ == "__main__":
+    unittest.main()
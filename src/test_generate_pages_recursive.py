@@ -0,0 +1,147 @@
+import os
+import tempfile
+import unittest
+from generate_pages_recursive import generate_pages_recursive, plan_page_jobs, PageBuildError
+from block_cache import BlockCache
+
+TEMPLATE = "<html><title>{{ Title }}</title><body>{{ Content }}</body></html>"
+
+
+class TestGeneratePagesRecursive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.content_dir = os.path.join(self.tmp.name, "content")
+        self.dest_dir = os.path.join(self.tmp.name, "docs")
+        self.template_path = os.path.join(self.tmp.name, "template.html")
+        with open(self.template_path, "w", encoding="utf-8") as f:
+            f.write(TEMPLATE)
+        self.write_page("index.md", "# Home\n\nWelcome.")
+        self.write_page("blog/long/index.md", "# Long\n\n" + "Some text.\n\n" * 50)
+        self.write_page("blog/short/index.md", "# Short\n\nHi.")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_page(self, relative_path, markdown):
+        path = os.path.join(self.content_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(markdown)
+
+    def read_output(self, relative_path):
+        with open(os.path.join(self.dest_dir, relative_path), encoding="utf-8") as f:
+            return f.read()
+
+    def test_plan_orders_largest_first(self):
+        jobs = plan_page_jobs(self.content_dir, self.dest_dir)
+        self.assertEqual(len(jobs), 3)
+        self.assertTrue(jobs[0][0].endswith(os.path.join("long", "index.md")))
+        self.assertTrue(jobs[0][1].endswith(os.path.join("long", "index.html")))
+
+    def test_serial_build(self):
+        summary = generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir)
+        self.assertIn("<title>Home</title>", self.read_output("index.html"))
+        self.assertIn("<title>Short</title>", self.read_output("blog/short/index.html"))
+        word_counts = {os.path.relpath(path, self.dest_dir): info.word_count
+                       for path, info in summary.page_info.items()}
+        self.assertEqual(word_counts["index.html"], 2)
+
+    def test_parallel_build_reports_page_info(self):
+        summary = generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir, jobs=2)
+        titles = {os.path.relpath(path, self.dest_dir): info.title for path, info in summary.page_info.items()}
+        self.assertEqual(titles, {"index.html": "Home", os.path.join("blog", "long", "index.html"): "Long",
+                                  os.path.join("blog", "short", "index.html"): "Short"})
+
+    def test_parallel_build_matches_serial(self):
+        generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir)
+        serial = self.read_output("blog/long/index.html")
+        os.remove(os.path.join(self.dest_dir, "blog/long/index.html"))
+        generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir, jobs=2)
+        self.assertEqual(self.read_output("blog/long/index.html"), serial)
+
+    def test_large_pages_are_rendered_in_chunks(self):
+        generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir)
+        serial = self.read_output("blog/long/index.html")
+        summary = generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir, jobs=2,
+                                           force=True, chunk_threshold=100, chunk_size=50)
+        self.assertEqual(len(summary.rendered), 3)
+        self.assertEqual(self.read_output("blog/long/index.html"), serial)
+
+    def test_large_pages_go_first_and_skip_the_block_cache(self):
+        cache = BlockCache()
+        summary = generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir, jobs=2,
+                                           block_cache=cache, chunk_threshold=100, chunk_size=50)
+        # The chunked page is finished before any small page is submitted
+        self.assertTrue(summary.rendered[0].endswith(os.path.join("long", "index.html")))
+        # "# Home", "Welcome.", "# Short", "Hi."
+        self.assertEqual(len(cache), 4)
+
+    def test_block_cache_is_filled_by_workers(self):
+        generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir)
+        uncached = self.read_output("blog/long/index.html")
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                cache = BlockCache()
+                generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir,
+                                         jobs=jobs, force=True, block_cache=cache)
+                self.assertEqual(self.read_output("blog/long/index.html"), uncached)
+                # "# Home", "Welcome.", "# Long", "Some text.", "# Short", "Hi."
+                self.assertEqual(len(cache), 6)
+                self.assertEqual(cache.misses, 6)
+                self.assertEqual(cache.hits, 49)
+                # The parent's cache keeps no delta, only its bounded entries
+                self.assertFalse(cache._added)
+
+    def test_serial_build_keeps_block_cache_bounded(self):
+        cache = BlockCache(maxsize=2)
+        generate_pages_recursive(self.content_dir, self.template_path, self.dest_dir, block_cache=cache)
+        self.assertEqual(len(cache), 2)
+        self.assertFalse(cache._added)
+
+    def test_failures_are_collected(self):
+        self.write_page("broken/index.md", "No title here.")
+        self.write_page("also-broken/index.md", "Still no title.")
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                with self.assertRaises(PageBuildError) as context:
+                    generate_pages_recursive(
+                        self.content_dir, self.template_path, self.dest_dir, jobs=jobs)
+                self.assertEqual(len(context.exception.failures), 2)
+                # The healthy pages are still written
+                self.assertIn("<title>Home</title>", self.read_output("index.html"))
+
+    def test_incremental_build(self):
+        manifest_path = os.path.join(self.tmp.name, ".cache", "manifest.json")
+        first = generate_pages_recursive(
+            self.content_dir, self.template_path, self.dest_dir, manifest_path=manifest_path)
+        self.assertEqual(len(first.rendered), 3)
+
+        second = generate_pages_recursive(
+            self.content_dir, self.template_path, self.dest_dir, manifest_path=manifest_path)
+        self.assertEqual(second.rendered, [])
+        self.assertEqual(len(second.up_to_date), 3)
+
+        self.write_page("blog/short/index.md", "# Shorter\n\nHi.")
+        os.remove(os.path.join(self.content_dir, "blog", "long", "index.md"))
+        third = generate_pages_recursive(
+            self.content_dir, self.template_path, self.dest_dir, manifest_path=manifest_path)
+        self.assertEqual(len(third.rendered), 1)
+        self.assertIn("<title>Shorter</title>", self.read_output("blog/short/index.html"))
+        self.assertEqual(len(third.removed), 1)
+        self.assertFalse(os.path.exists(os.path.join(self.dest_dir, "blog", "long")))
+
+        rebuilt = generate_pages_recursive(
+            self.content_dir, self.template_path, self.dest_dir, basepath="/repo/",
+            manifest_path=manifest_path)
+        self.assertEqual(len(rebuilt.rendered), 2)
+
+        forced = generate_pages_recursive(
+            self.content_dir, self.template_path, self.dest_dir, basepath="/repo/",
+            manifest_path=manifest_path, force=True)
+        self.assertEqual(len(forced.rendered), 2)
+        self.assertEqual(forced.written, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,8 @@
+import io
+import sys
 import unittest
-from htmlnode import HTMLNode, HTMLLeafNode, HTMLParentNode
+from htmlnode import (HTMLNode, HTMLLeafNode, HTMLParentNode, HTMLRawNode, EMPTY_CHILDREN, EMPTY_PROPS,
+                      escape_attr, escape_text)
 
 
 class TestHTMLNode(unittest.TestCase):
@@ -39,6 +42,25 @@ class TestHTMLNode(unittest.TestCase):
         node = HTMLNode(tag='input', props={'type': 'text', 'value': 'Hello'})
         self.assertEqual(node.props_to_html(), ' type="text" value="Hello"')
 
+    def test_empty_children_and_props_are_shared(self):
+        """Test that nodes without children or props share the immutable sentinels."""
+        first = HTMLNode(tag='br')
+        second = HTMLLeafNode(tag=None, value='text')
+        self.assertIs(first.children, EMPTY_CHILDREN)
+        self.assertIs(second.children, EMPTY_CHILDREN)
+        self.assertIs(first.props, second.props)
+        with self.assertRaises(TypeError):
+            first.children.append(second)
+        with self.assertRaises(TypeError):
+            second.props["class"] = "x"
+
+    def test_slots(self):
+        """Test that nodes don't carry a per-instance __dict__."""
+        node = HTMLLeafNode(tag='b', value='bold')
+        self.assertFalse(hasattr(node, '__dict__'))
+        with self.assertRaises(AttributeError):
+            node.extra = 1
+
     def test_to_html_not_implemented(self):
         """Test that to_html raises NotImplementedError."""
         node = HTMLNode(tag='div')
@@ -144,5 +166,108 @@ class TestHTMLParentNode(unittest.TestCase):
             HTMLParentNode(tag='div', children=[]).to_html()
 
 
+class TestTrustedConstruction(unittest.TestCase):
+    """Tests for the trusted constructors and validate()."""
+
+    def test_trusted_nodes_render_like_checked_ones(self):
+        trusted = HTMLParentNode.trusted("p", [HTMLLeafNode.trusted(None, "Hi "),
+                                               HTMLLeafNode.trusted("b", "there")])
+        checked = HTMLParentNode("p", [HTMLLeafNode(None, "Hi "), HTMLLeafNode("b", "there")])
+        self.assertEqual(trusted.to_html(), checked.to_html())
+        self.assertIs(trusted.props, EMPTY_PROPS)
+        trusted.validate()
+
+    def test_trusted_skips_checks(self):
+        node = HTMLParentNode.trusted("div", ["not_a_node"])
+        self.assertEqual(node.children, ["not_a_node"])
+
+    def test_validate_finds_nested_problems(self):
+        bad_leaf = HTMLLeafNode.trusted(None, None)
+        tree = HTMLParentNode.trusted("div", [HTMLParentNode.trusted("p", [bad_leaf])])
+        with self.assertRaises(ValueError):
+            tree.validate()
+
+        tree = HTMLParentNode.trusted("div", [HTMLLeafNode.trusted("a", "x", {"href": 1})])
+        with self.assertRaises(TypeError):
+            tree.validate()
+
+        tree = HTMLParentNode.trusted("div", [HTMLParentNode.trusted(None, [])])
+        with self.assertRaises(ValueError):
+            tree.validate()
+
+        with self.assertRaises(TypeError):
+            HTMLParentNode.trusted("div", ["not_a_node"]).validate()
+
+    def test_public_constructors_still_validate(self):
+        with self.assertRaises(ValueError):
+            HTMLLeafNode(None, None)
+        with self.assertRaises(TypeError):
+            HTMLLeafNode("a", "x", {"href": 1})
+
+
+class TestWriteHTML(unittest.TestCase):
+    """Tests for the iterative serializer."""
+
+    def test_write_html_matches_to_html(self):
+        node = HTMLParentNode("div", [
+            HTMLParentNode("p", [HTMLLeafNode(None, "Hi "), HTMLLeafNode("b", "there")]),
+            HTMLLeafNode("img", "", {"src": "/a.png", "alt": "a"}),
+            HTMLLeafNode("a", "link", {"href": "/b"}),
+        ], {"class": "box"})
+        buffer = io.StringIO()
+        node.write_html(buffer)
+        self.assertEqual(buffer.getvalue(),
+                         '<div class="box"><p>Hi <b>there</b></p><img src="/a.png" alt="a" /><a href="/b">link</a></div>')
+        self.assertEqual(node.to_html(), buffer.getvalue())
+
+    def test_deep_nesting_does_not_recurse(self):
+        depth = sys.getrecursionlimit() * 2
+        node = HTMLLeafNode(None, "x")
+        for _ in range(depth):
+            node = HTMLParentNode.trusted("span", [node])
+        html = node.to_html()
+        self.assertEqual(html, "<span>" * depth + "x" + "</span>" * depth)
+
+    def test_errors_from_nested_parents(self):
+        node = HTMLParentNode("div", [HTMLParentNode.trusted("p", [])])
+        with self.assertRaises(ValueError):
+            node.to_html()
+        node = HTMLParentNode("div", [HTMLParentNode.trusted(None, [HTMLLeafNode(None, "x")])])
+        with self.assertRaises(ValueError):
+            node.write_html(io.StringIO())
+
+
+class TestEscaping(unittest.TestCase):
+    """Tests for text and attribute escaping."""
+
+    def test_escape_text(self):
+        self.assertEqual(escape_text('a < b && c > "d"'), 'a &lt; b &amp;&amp; c &gt; "d"')
+        self.assertEqual(escape_text("&lt;"), "&amp;lt;")
+
+    def test_escape_attr(self):
+        self.assertEqual(escape_attr('/a?b=1&c="<x>"'), '/a?b=1&amp;c=&quot;&lt;x&gt;&quot;')
+
+    def test_plain_strings_are_returned_unchanged(self):
+        text = "".join(["plain ", "text"])
+        self.assertIs(escape_text(text), text)
+        self.assertIs(escape_attr(text), text)
+        self.assertIs(escape_text('"quoted"'), escape_text('"quoted"'))
+
+    def test_leaf_and_props_are_escaped(self):
+        self.assertEqual(HTMLLeafNode(None, "1 < 2").to_html(), "1 &lt; 2")
+        self.assertEqual(HTMLLeafNode("code", "<b>").to_html(), "<code>&lt;b&gt;</code>")
+        self.assertEqual(HTMLLeafNode("a", "x", {"href": '/q?a=1&b="2"'}).to_html(),
+                         '<a href="/q?a=1&amp;b=&quot;2&quot;">x</a>')
+        self.assertEqual(HTMLLeafNode("img", "", {"src": "/a.png", "alt": "<cat>"}).to_html(),
+                         '<img src="/a.png" alt="&lt;cat&gt;" />')
+
+    def test_raw_node_is_not_escaped(self):
+        node = HTMLParentNode("div", [HTMLRawNode("<p>a &amp; b</p>"), HTMLLeafNode(None, "&")])
+        self.assertEqual(node.to_html(), "<div><p>a &amp; b</p>&amp;</div>")
+        node.validate()
+        with self.assertRaises(TypeError):
+            HTMLRawNode(None)
+
+
 if __name__ == '__main__':
     unittest.main()
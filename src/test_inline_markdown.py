@@ -0,0 +1,47 @@
+import unittest
+from inline_markdown import inline_to_html_nodes
+
+
+class TestInlineToHtmlNodes(unittest.TestCase):
+
+    def render(self, text, basepath="/"):
+        return "".join(node.to_html() for node in inline_to_html_nodes(text, basepath))
+
+    def test_plain_text(self):
+        nodes = inline_to_html_nodes("Just text.")
+        self.assertEqual(len(nodes), 1)
+        self.assertIsNone(nodes[0].tag)
+        self.assertEqual(nodes[0].value, "Just text.")
+
+    def test_empty_text(self):
+        self.assertEqual(inline_to_html_nodes(""), [])
+
+    def test_all_formats_in_order(self):
+        self.assertEqual(
+            self.render("a **b** _c_ `d` [e](/f) ![g](/h.png) i"),
+            'a <b>b</b> <i>c</i> <code>d</code> <a href="/f">e</a> <img alt="g" src="/h.png" /> i')
+
+    def test_interleaved_formats(self):
+        self.assertEqual(
+            self.render("_one_ **two** _three_ **four**"),
+            "<i>one</i> <b>two</b> <i>three</i> <b>four</b>")
+
+    def test_image_is_not_a_link(self):
+        nodes = inline_to_html_nodes("![alt](/a.png)")
+        self.assertEqual(len(nodes), 1)
+        self.assertEqual(nodes[0].tag, "img")
+
+    def test_code_hides_other_syntax(self):
+        self.assertEqual(self.render("`a_b_c` and **d**"), "<code>a_b_c</code> and <b>d</b>")
+
+    def test_urls_with_parentheses(self):
+        self.assertEqual(
+            self.render("[Foo](https://en.wikipedia.org/wiki/Foo_(bar)) and ![cat](/c_(1).png)."),
+            '<a href="https://en.wikipedia.org/wiki/Foo_(bar)">Foo</a> and <img alt="cat" src="/c_(1).png" />.')
+
+    def test_basepath(self):
+        self.assertEqual(self.render("[home](/)", "/repo/"), '<a href="/repo/">home</a>')
+
+
+if __name__ == "__main__":
+    unittest.main()
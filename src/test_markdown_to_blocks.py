@@ -1,5 +1,6 @@
+import io
 import unittest
-from markdown_to_blocks import markdown_to_blocks
+from markdown_to_blocks import iter_markdown_blocks, markdown_to_blocks
 
 class TestMarkdownToBlocks(unittest.TestCase):
     def test_markdown_to_blocks(self):
@@ -107,6 +108,35 @@ def example_function():
         md = """<div>This is a div</div>"""
         blocks = markdown_to_blocks(md)
         self.assertEqual(blocks, ["<div>This is a div</div>"])
+    def test_code_fence_keeps_blank_and_hash_lines(self):
+        md = "Intro\n```python\n# a comment\n\nx = 1\n```\nAfter the code\n\n# Heading"
+        blocks = markdown_to_blocks(md)
+        self.assertEqual(blocks, ["Intro", "```python\n# a comment\n\nx = 1\n```", "After the code", "# Heading"])
+
+    def test_unclosed_fence_runs_to_the_end(self):
+        md = "```\ncode\n\n# more code"
+        self.assertEqual(markdown_to_blocks(md), ["```\ncode\n\n# more code"])
+
+    def test_inline_code_line_is_not_a_fence(self):
+        md = "```inline```\n\nText"
+        self.assertEqual(markdown_to_blocks(md), ["```inline```", "Text"])
+
+    def test_line_numbers(self):
+        md = "\n# Title\nText under it\n\n\n- a\n- b\r\n\r\n```\n\n```\nEnd"
+        self.assertEqual(list(iter_markdown_blocks(md)), [
+            (2, "# Title\nText under it"),
+            (6, "- a\n- b"),
+            (9, "```\n\n```"),
+            (12, "End"),
+        ])
+
+    def test_reads_file_objects_lazily(self):
+        source = io.StringIO("First\n\nSecond\n")
+        blocks = iter_markdown_blocks(source)
+        self.assertEqual(next(blocks), (1, "First"))
+        # Nothing past the first block's terminating blank line has been read
+        self.assertEqual(source.read(), "Second\n")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,9 @@
+import io
+import pickle
 import unittest
-from markdown_to_html_node import markdown_to_html_node
+from unittest import mock
+from markdown_to_html_node import markdown_to_html_node, MarkdownRenderError
+from block_handlers import BLOCK_HANDLERS
 from htmlnode import HTMLParentNode
 
 class TestMarkdownToHtmlNode(unittest.TestCase):
@@ -57,6 +61,16 @@ class TestMarkdownToHtmlNode(unittest.TestCase):
         self.assertEqual(result.children[0].tag, "h1")
         self.assertEqual(result.children[0].children[0].value, "Heading 1")
 
+    def test_heading_levels_and_ids(self):
+        """Test that heading levels are kept and repeated ids get a suffix."""
+        markdown = "# Guide\n\n## Install\n\n###### Notes & _Tips_\n\n## Install"
+        self.assertEqual(
+            markdown_to_html_node(markdown).to_html(),
+            '<div><h1 id="guide">Guide</h1><h2 id="install">Install</h2>'
+            '<h6 id="notes-tips">Notes &amp; <i>Tips</i></h6><h2 id="install-1">Install</h2></div>')
+        # Every page starts with a fresh set of ids
+        self.assertIn('<h2 id="install">', markdown_to_html_node(markdown).to_html())
+
     def test_inline_formatting_in_list(self):
         """Test inline formatting within list items."""
         markdown = """\
@@ -141,6 +155,18 @@ def main():
         self.assertIn(
             "def main():", result.children[3].children[0].value)
 
+    def test_special_characters_are_escaped(self):
+        """Test that markup characters in text and code come out as entities."""
+        markdown = "a < b & **c > d**\n\n```\nif a < b:\n```"
+        html = markdown_to_html_node(markdown).to_html()
+        self.assertEqual(html, "<div><p>a &lt; b &amp; <b>c &gt; d</b></p>"
+                               "<pre><code>if a &lt; b:</code></pre></div>")
+
+    def test_parsed_tree_validates(self):
+        """Test that the tree built with trusted constructors is well formed."""
+        markdown = "# T\n\nA **b** [c](/d) ![e](/f)\n\n- g\n\n1. h\n\n> i\n\n```\nj\n```\n\n![k](/l)"
+        markdown_to_html_node(markdown).validate()
+
     def test_image_conversion(self):
         """Test that markdown image syntax is converted to an <img> tag."""
         markdown = "![JRR Tolkien sitting](/images/tolkien.png)"
@@ -152,5 +178,72 @@ def main():
         self.assertEqual(
             result.children[0].props["alt"], "JRR Tolkien sitting")
 
+    def test_interleaved_inline_formatting(self):
+        """Test that interleaved formats are emitted in document order."""
+        markdown = "_a_ then **b** then _c_ and `d`"
+        result = markdown_to_html_node(markdown)
+        self.assertEqual(result.to_html(),
+                         "<div><p><i>a</i> then <b>b</b> then <i>c</i> and <code>d</code></p></div>")
+
+    def test_inline_formatting_in_list_item_headings_and_quotes(self):
+        """Test that every inline format in a list item, heading and quote is parsed."""
+        markdown = "# A **big** title\n\n- **one** and _two_ and **three**\n\n> quoted _text_"
+        result = markdown_to_html_node(markdown)
+        self.assertEqual(result.children[0].to_html(), '<h1 id="a-big-title">A <b>big</b> title</h1>')
+        self.assertEqual(result.children[1].to_html(),
+                         "<ul><li><b>one</b> and <i>two</i> and <b>three</b></li></ul>")
+        self.assertEqual(result.children[2].to_html(), "<blockquote>quoted <i>text</i></blockquote>")
+
+    def test_basepath_applied_to_links_and_images(self):
+        """Test that site-absolute URLs are resolved against the basepath."""
+        result = markdown_to_html_node(
+            "[Home](/) and [out](https://example.com)\n\n![Tolkien](/images/tolkien.png)", basepath="/repo/")
+        self.assertEqual(result.children[0].children[0].props["href"], "/repo/")
+        self.assertEqual(result.children[0].children[2].props["href"], "https://example.com")
+        self.assertEqual(result.children[1].props["src"], "/repo/images/tolkien.png")
+
+    def test_code_fence_language(self):
+        """Test that the fence info string becomes a class instead of code."""
+        result = markdown_to_html_node("```python\nprint('hi')\n```")
+        self.assertEqual(result.to_html(),
+                         '<div><pre><code class="language-python">print(\'hi\')</code></pre></div>')
+
+    def test_file_object_input(self):
+        """Test that a file object renders like the same text."""
+        markdown = "# Title\n\n```\ncode\n\nmore\n```"
+        self.assertEqual(markdown_to_html_node(io.StringIO(markdown)).to_html(),
+                         markdown_to_html_node(markdown).to_html())
+        self.assertEqual(markdown_to_html_node(markdown).to_html(),
+                         '<div><h1 id="title">Title</h1><pre><code>code\n\nmore</code></pre></div>')
+
+    def test_errors_name_the_block_line(self):
+        """Test that a failing block is reported with its source line."""
+        paragraph = BLOCK_HANDLERS.handler_for("text")
+        with mock.patch.object(paragraph, "render", side_effect=ValueError("bad block")):
+            with self.assertRaises(MarkdownRenderError) as context:
+                markdown_to_html_node("# Title\n\n- item\n\n\nbroken paragraph")
+        self.assertEqual(context.exception.line_number, 6)
+        self.assertEqual(str(context.exception), "line 6: ValueError: bad block")
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+        copy = pickle.loads(pickle.dumps(context.exception))
+        self.assertEqual((copy.line_number, str(copy)), (6, str(context.exception)))
+
+    def test_basepath_not_applied_to_code(self):
+        """Test that href-like text inside code blocks is left alone."""
+        markdown = '```\n<a href="/x">\n```'
+        result = markdown_to_html_node(markdown, basepath="/repo/")
+        self.assertIn('href="/x"', result.children[0].children[0].value)
+
+    def test_no_rendering_for_disabled_debug_logging(self):
+        """Test that debug payloads aren't rendered unless debug logging is on."""
+        markdown = "> quote\n\n- item\n\n```\ncode\n```"
+        with mock.patch.object(HTMLParentNode, "to_html") as to_html:
+            markdown_to_html_node(markdown)
+        to_html.assert_not_called()
+
+        with self.assertLogs(level="DEBUG") as logs:
+            markdown_to_html_node(markdown)
+        self.assertTrue(any("Rendered block: <blockquote>" in line for line in logs.output))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
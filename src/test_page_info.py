@@ -0,0 +1,111 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from block_handlers import BLOCK_HANDLERS
+from block_cache import BlockCache
+from chunked_render import markdown_to_html_node_chunked
+from markdown_to_html_node import markdown_to_html_node
+from page_info import PageInfo
+
+MARKDOWN = """## Intro
+
+```
+# not a heading
+```
+
+# The **Title**
+
+Some words with a [link](/blog) and ![a cat](/cat.png).
+
+- one [two](https://example.com)
+- three
+
+# Second h1
+
+## Intro"""
+
+
+class TestPageInfo(unittest.TestCase):
+
+    def analyze(self, markdown, **kwargs):
+        page_info = PageInfo()
+        html = markdown_to_html_node(markdown, "/repo/", page_info=page_info, **kwargs).to_html()
+        return html, page_info
+
+    def test_metadata_from_one_parse(self):
+        _, page_info = self.analyze(MARKDOWN)
+        self.assertEqual(page_info.title, "The Title")
+        self.assertEqual(page_info.headings, [(2, "Intro", "intro"), (1, "The Title", "the-title"),
+                                              (1, "Second h1", "second-h1"), (2, "Intro", "intro-1")])
+        self.assertEqual(page_info.links, ["/repo/blog", "https://example.com"])
+        self.assertEqual(page_info.images, [("a cat", "/repo/cat.png")])
+        # Intro, # not a heading, The Title, Some words with a link and ., one two, three, Second h1, Intro
+        self.assertEqual(page_info.word_count, 1 + 4 + 2 + 7 + 2 + 1 + 2 + 1)
+        self.assertEqual(page_info.reading_minutes, 1)
+
+    def test_cached_and_chunked_rendering_report_the_same(self):
+        html, expected = self.analyze(MARKDOWN)
+        self.assertIn('<h2 id="intro">Intro</h2>', html)
+        self.assertIn('<h2 id="intro-1">Intro</h2>', html)
+        cache = BlockCache()
+        self.assertEqual(self.analyze(MARKDOWN, block_cache=cache), (html, expected))
+        # Served entirely from the cache
+        self.assertEqual(self.analyze(MARKDOWN, block_cache=cache), (html, expected))
+        # The repeated heading is a hit even on the first page, and still gets its own id
+        self.assertEqual(cache.misses, 6)
+
+        page_info = PageInfo()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            node = markdown_to_html_node_chunked(MARKDOWN, executor, "/repo/", chunk_size=20, page_info=page_info)
+        self.assertEqual((node.to_html(), page_info), (html, expected))
+
+    def test_heading_ids_that_cannot_be_rewritten_in_place(self):
+        heading = BLOCK_HANDLERS.handler_for("# x")
+        render = heading.render
+
+        def render_with_class(info, basepath, debug):
+            # Puts an attribute before the id, so cached and chunked HTML can't be patched
+            node = render(info, basepath, debug)
+            node.props = {"class": "anchor", **node.props}
+            return node
+
+        with mock.patch.object(heading, "render", side_effect=render_with_class):
+            html, expected = self.analyze(MARKDOWN)
+            self.assertIn('<h2 class="anchor" id="intro-1">Intro</h2>', html)
+            self.assertEqual(self.analyze(MARKDOWN, block_cache=BlockCache()), (html, expected))
+            page_info = PageInfo()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                node = markdown_to_html_node_chunked(MARKDOWN, executor, "/repo/", chunk_size=20,
+                                                     page_info=page_info)
+            self.assertEqual((node.to_html(), page_info), (html, expected))
+        # Every table of contents entry links to an anchor on the page
+        for _, _, anchor in expected.headings:
+            self.assertIn(f'id="{anchor}"', html)
+
+    def test_table_of_contents(self):
+        page_info = PageInfo(headings=[(1, "Title", "title"), (2, "A & B", "a-b"), (3, "Deep", "deep"),
+                                       (2, "C", "c"), (1, "End", "end")])
+        self.assertEqual(
+            page_info.table_of_contents().to_html(),
+            '<ul><li><a href="#title">Title</a><ul><li><a href="#a-b">A &amp; B</a>'
+            '<ul><li><a href="#deep">Deep</a></li></ul></li><li><a href="#c">C</a></li></ul></li>'
+            '<li><a href="#end">End</a></li></ul>')
+        # A page that starts below its top level keeps those entries at the outer level
+        page_info = PageInfo(headings=[(3, "Note", "note"), (1, "Title", "title"), (2, "Part", "part")])
+        self.assertEqual(
+            page_info.table_of_contents().to_html(),
+            '<ul><li><a href="#note">Note</a></li><li><a href="#title">Title</a>'
+            '<ul><li><a href="#part">Part</a></li></ul></li></ul>')
+        self.assertIsNone(PageInfo().table_of_contents())
+
+    def test_dict_round_trip(self):
+        _, page_info = self.analyze(MARKDOWN)
+        data = page_info.to_dict()
+        self.assertEqual(data["reading_minutes"], 1)
+        self.assertEqual(PageInfo.from_dict(data), page_info)
+        self.assertEqual(PageInfo(word_count=401).reading_minutes, 3)
+        self.assertIsNone(PageInfo().title)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from slugs import slugify, SlugSet, reassign_heading_ids
+
+
+class TestSlugs(unittest.TestCase):
+
+    def test_slugify(self):
+        self.assertEqual(slugify("Reasons I like Tolkien!"), "reasons-i-like-tolkien")
+        self.assertEqual(slugify("  Tom & Jerry -- the_movie "), "tom-jerry-the-movie")
+        self.assertEqual(slugify("Café 2.0"), "café-20")
+        self.assertEqual(slugify("?!"), "section")
+
+    def test_claim_adds_the_lowest_free_suffix(self):
+        slugs = SlugSet()
+        self.assertEqual([slugs.claim(slug) for slug in ["intro", "intro", "intro-1", "intro"]],
+                         ["intro", "intro-1", "intro-1-1", "intro-2"])
+
+    def test_reassign_heading_ids(self):
+        html = ('<h2 id="intro">Intro</h2><p>&lt;h2 id="intro"&gt; h2 id="intro"</p>'
+                '<h2 id="intro">Intro</h2><h3 id="intro">Intro</h3>')
+        headings = [(2, "Intro", "intro"), (2, "Intro", "intro"), (3, "Intro", "intro")]
+        slugs = SlugSet()
+        html, headings = reassign_heading_ids(html, headings, slugs)
+        self.assertEqual(html, '<h2 id="intro">Intro</h2><p>&lt;h2 id="intro"&gt; h2 id="intro"</p>'
+                               '<h2 id="intro-1">Intro</h2><h3 id="intro-2">Intro</h3>')
+        self.assertEqual(headings, [(2, "Intro", "intro"), (2, "Intro", "intro-1"), (3, "Intro", "intro-2")])
+        # Ids are unique across calls sharing a SlugSet, as for the chunks of one page
+        self.assertEqual(reassign_heading_ids('<h1 id="intro">Intro</h1>', [(1, "Intro", "intro")], slugs)[0],
+                         '<h1 id="intro-3">Intro</h1>')
+
+
+    def test_reassign_raises_when_a_tag_is_missing(self):
+        slugs = SlugSet()
+        slugs.claim("intro")
+        html = '<h2 id="intro">Intro</h2><h2 class="x" id="intro">Intro</h2>'
+        with self.assertRaises(ValueError):
+            reassign_heading_ids(html, [(2, "Intro", "intro"), (2, "Intro", "intro")], slugs)
+        # Nothing was claimed, so the caller can render again with the same ids
+        self.assertEqual(slugs.used, {"intro"})
+
+
+if __name__ == "__main__":
+    unittest.main()
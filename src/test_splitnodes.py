@@ -167,5 +167,21 @@ class TestSplitNodes(unittest.TestCase):
 
         self.assertEqual(new_nodes, expected_nodes)
 
+    def test_split_nodes_link_with_padded_text(self):
+        """
+        Test that matches are sliced by offset even when their text is stripped.
+        """
+        node = TextNode("Go [ home ](/) now", TextType.TEXT)
+        new_nodes = split_nodes_link([node])
+
+        expected_nodes = [
+            TextNode("Go ", TextType.TEXT),
+            TextNode("home", TextType.LINK),
+            TextNode("/", TextType.TEXT),
+            TextNode(" now", TextType.TEXT),
+        ]
+
+        self.assertEqual(new_nodes, expected_nodes)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
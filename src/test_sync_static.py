@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from sync_static import sync_static, file_is_current
+
+
+class TestSyncStatic(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.static_dir = os.path.join(self.tmp.name, "static")
+        self.public_dir = os.path.join(self.tmp.name, "docs")
+        self.record_path = os.path.join(self.tmp.name, ".cache", "static.json")
+        self.write(self.static_dir, "index.css", "body {}")
+        self.write(self.static_dir, "images/a.png", "aaaa")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, base, relative_path, content):
+        path = os.path.join(base, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def sync(self, **kwargs):
+        return sync_static(self.static_dir, self.public_dir, record_path=self.record_path, **kwargs)
+
+    def test_first_sync_copies_everything(self):
+        summary = self.sync()
+        self.assertEqual(summary.copied_files, 2)
+        self.assertEqual(summary.copied_bytes, 11)
+        self.assertTrue(os.path.exists(os.path.join(self.public_dir, "images", "a.png")))
+
+    def test_second_sync_skips_unchanged(self):
+        self.sync()
+        summary = self.sync()
+        self.assertEqual(summary.copied_files, 0)
+        self.assertEqual(summary.skipped_files, 2)
+
+    def test_changed_file_is_copied(self):
+        self.sync()
+        self.write(self.static_dir, "index.css", "body { color: red; }")
+        summary = self.sync()
+        self.assertEqual(summary.copied_files, 1)
+        with open(os.path.join(self.public_dir, "index.css"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "body { color: red; }")
+
+    def test_checksum_detects_same_size_edit(self):
+        self.sync()
+        src = self.write(self.static_dir, "images/a.png", "bbbb")
+        dest = os.path.join(self.public_dir, "images", "a.png")
+        stat = os.stat(dest)
+        os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertTrue(file_is_current(src, dest))
+        self.assertFalse(file_is_current(src, dest, checksum=True))
+        self.assertEqual(self.sync(checksum=True).copied_files, 1)
+
+    def test_stale_files_removed_and_pages_kept(self):
+        self.sync()
+        page = self.write(self.public_dir, "blog/index.html", "<html></html>")
+        os.remove(os.path.join(self.static_dir, "images", "a.png"))
+        summary = self.sync()
+        self.assertEqual(summary.deleted_files, 1)
+        self.assertEqual(summary.deleted_bytes, 4)
+        self.assertFalse(os.path.exists(os.path.join(self.public_dir, "images")))
+        self.assertTrue(os.path.exists(page))
+
+    def test_without_record_nothing_is_deleted(self):
+        sync_static(self.static_dir, self.public_dir)
+        os.remove(os.path.join(self.static_dir, "index.css"))
+        summary = sync_static(self.static_dir, self.public_dir)
+        self.assertEqual(summary.deleted_files, 0)
+        self.assertTrue(os.path.exists(os.path.join(self.public_dir, "index.css")))
+
+    def test_hardlink_mode_in_thread_pool(self):
+        summary = self.sync(mode="hardlink", workers=4)
+        self.assertEqual(summary.methods, {"hardlink": 2})
+        self.assertTrue(os.path.samefile(
+            os.path.join(self.static_dir, "index.css"), os.path.join(self.public_dir, "index.css")))
+        self.assertEqual(self.sync(mode="hardlink").skipped_files, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
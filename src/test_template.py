@@ -0,0 +1,74 @@
+import io
+import os
+import pickle
+import tempfile
+import unittest
+from template import compile_template, load_template, Template
+from htmlnode import HTMLLeafNode, HTMLParentNode, HTMLRawNode
+
+
+class TestTemplate(unittest.TestCase):
+
+    def test_compile_splits_literals_and_slots(self):
+        template = compile_template("<title>{{ Title }}</title><p>{{Content}}</p>")
+        self.assertEqual(template.literals, ["<title>", "</title><p>", "</p>"])
+        self.assertEqual(template.slots, ["Title", "Content"])
+
+    def test_render(self):
+        template = compile_template("<title>{{ Title }}</title><article>{{ Content }}</article>")
+        self.assertEqual(
+            template.render({"Title": "Home", "Content": HTMLRawNode("<p>Hi</p>")}),
+            "<title>Home</title><article><p>Hi</p></article>")
+
+    def test_extra_and_missing_slots(self):
+        template = compile_template('<meta content="{{ Description }}">{{ Date }}|{{ Title }}')
+        self.assertEqual(template.render({"Description": "About", "Title": "T"}),
+                         '<meta content="About">|T')
+
+    def test_string_values_are_escaped(self):
+        template = compile_template('<meta content="{{ Description }}"><title>{{ Title }}</title>{{ Count }}')
+        self.assertEqual(template.render({"Description": 'Say "hi" & <wave>', "Title": "Tom & Jerry", "Count": 3}),
+                         '<meta content="Say &quot;hi&quot; &amp; &lt;wave&gt;"><title>Tom &amp; Jerry</title>3')
+
+    def test_repeated_slot(self):
+        template = compile_template("{{ Title }} - {{ Title }}")
+        self.assertEqual(template.render({"Title": "A"}), "A - A")
+
+    def test_no_slots(self):
+        template = compile_template("<html></html>")
+        self.assertEqual(template.render({}), "<html></html>")
+
+    def test_slot_values_are_not_reparsed(self):
+        template = compile_template("{{ Content }}")
+        self.assertEqual(template.render({"Content": "{{ Title }}", "Title": "x"}), "{{ Title }}")
+
+    def test_basepath_applied_to_literals_only(self):
+        template = compile_template('<link href="/index.css" />{{ Content }}', basepath="/repo/")
+        self.assertEqual(template.literals[0], '<link href="/repo/index.css" />')
+        self.assertEqual(template.render({"Content": HTMLRawNode('<a href="/x">')}),
+                         '<link href="/repo/index.css" /><a href="/x">')
+
+    def test_node_values_are_serialized_in_place(self):
+        template = compile_template("<title>{{ Title }}</title>{{ Content }}")
+        node = HTMLParentNode("div", [HTMLLeafNode("p", "Hi")])
+        buffer = io.StringIO()
+        template.render_to(buffer, {"Title": "T", "Content": node})
+        self.assertEqual(buffer.getvalue(), "<title>T</title><div><p>Hi</p></div>")
+        self.assertEqual(template.render({"Title": "T", "Content": node}), buffer.getvalue())
+
+    def test_invalid_segments(self):
+        with self.assertRaises(ValueError):
+            Template(["a"], ["Title"])
+
+    def test_load_and_pickle(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "template.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("<h1>{{ Title }}</h1>")
+            template = load_template(path)
+        self.assertEqual(pickle.loads(pickle.dumps(template)), template)
+        self.assertEqual(template.source_hash, compile_template("<h1>{{ Title }}</h1>").source_hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,5 +55,29 @@ class TestTextToTextNode(unittest.TestCase):
         ]
         self.assertEqual(result, expected)
 
+    def test_links_and_images_keep_urls(self):
+        text = "See [the blog](/blog) and ![Tom](/images/tom.png)."
+        result = text_to_textnode(text)
+        expected = [
+            TextNode("See ", TextType.TEXT),
+            TextNode("the blog", TextType.LINK, "/blog"),
+            TextNode(" and ", TextType.TEXT),
+            TextNode("Tom", TextType.IMAGE, "/images/tom.png"),
+            TextNode(".", TextType.TEXT),
+        ]
+        self.assertEqual(result, expected)
+
+    def test_interleaved_formatting(self):
+        text = "**a** _b_ **c**"
+        result = text_to_textnode(text)
+        expected = [
+            TextNode("a", TextType.BOLD),
+            TextNode(" ", TextType.TEXT),
+            TextNode("b", TextType.ITALIC),
+            TextNode(" ", TextType.TEXT),
+            TextNode("c", TextType.BOLD),
+        ]
+        self.assertEqual(result, expected)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -20,6 +20,9 @@ class TestTextNode(unittest.TestCase):
         node2 = TextNode("This is a text node", TextType.BOLD)
         self.assertEqual(self.bold_text_node, node2)
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.normal_text_node, "__dict__"))
+
     def test_neq(self):
         node2 = TextNode("This is a different text node", TextType.BOLD)
         self.assertNotEqual(self.bold_text_node, node2)
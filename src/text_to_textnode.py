@@ -1,26 +1,19 @@
-from splitnodes import split_nodes_delimiter, split_nodes_image, split_nodes_link
-from textnode import TextNode, TextType
+from inline_markdown import iter_inline_tokens
+from textnode import TextNode
+
 
 def text_to_textnode(text):
     """
     Converts a string of text into a list of TextNode objects based on various formatting rules.
 
+    The text is lexed in a single left-to-right pass (see inline_markdown), so
+    the cost doesn't grow with the number of inline syntaxes. LINK and IMAGE
+    nodes carry their URL in TextNode.url.
+
     Args:
         text (str): The input text to be converted.
 
     Returns:
         list: A list of TextNode objects representing the formatted text.
     """
-    # Split the text into nodes based on delimiters
-    nodes = split_nodes_delimiter([TextNode(text, TextType.TEXT)], '**', TextType.BOLD)
-    nodes = split_nodes_delimiter(nodes, '_', TextType.ITALIC)
-    nodes = split_nodes_delimiter(nodes, '`', TextType.CODE)
-    
-    # Further split the nodes based on images
-    nodes = split_nodes_image(nodes)
-    
-    # Further split the nodes based on links
-    nodes = split_nodes_link(nodes)
-
-    return nodes
-
+    return [TextNode(value, text_type, url) for text_type, value, url in iter_inline_tokens(text)]
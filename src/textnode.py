@@ -1,5 +1,7 @@
 """This module defines a TextNode class that represents a text element 
 with various types (normal text, bold, italic, etc.)
+
+TextNode uses __slots__, so instances carry no per-instance __dict__.
 """
 
 from enum import Enum
@@ -15,6 +17,8 @@ class TextType(Enum):
 
 
 class TextNode:
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(self, text: str, text_type: TextType, url: str = None):
         if text_type is not None and not isinstance(text_type, TextType):
             raise ValueError(